@@ -26,6 +26,10 @@ PNG_FILE_PATTERN = "*.png"
 # Notification settings
 DEFAULT_NOTIFICATION_INTERVAL = 10
 
+# Oldest log lines are dropped past this point so per-append cost stays
+# flat over a multi-hour render instead of growing with total output
+LOG_MAX_BLOCKS = 5000
+
 # Shutdown delay options
 SHUTDOWN_DELAYS = [
     "No delay",
@@ -36,5 +40,16 @@ SHUTDOWN_DELAYS = [
     "1 hour"
 ]
 
+# Seconds for each shutdown delay option ("No delay" keeps a minimal
+# safety margin so the user can still cancel)
+SHUTDOWN_DELAY_SECONDS = {
+    "No delay": 5,
+    "1 minute": 60,
+    "5 minutes": 300,
+    "10 minutes": 600,
+    "30 minutes": 1800,
+    "1 hour": 3600,
+}
+
 # Debug settings
 DEBUG = os.environ.get('HARDEEN_DEBUG', '0') == '1'
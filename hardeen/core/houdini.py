@@ -1,22 +1,54 @@
 import os
+import re
 import json
+import hashlib
 import subprocess
 from pathlib import Path
 from typing import Tuple, List, Dict, Optional
 
+# Translation table that deletes line breaks from file.history content
+_NEWLINE_TABLE = {ord('\n'): None, ord('\r'): None}
+
+# Matches one hip path inside the concatenated HIP{...} section; the lazy
+# segment group stops at the first segment ending in .hip, mirroring the
+# old split-and-accumulate behaviour
+_HIP_PATH_RE = re.compile(r'/(?:[^/{}]+/)*?[^/{}]+\.hip(?=/|$)')
+
+# ROP node types Hardeen knows how to drive
+_ROP_TYPES = frozenset({"rop_geometry", "Redshift_ROP", "opengl"})
+
 class HoudiniManager:
     """Manages Houdini-specific operations and interactions"""
 
+    # Last resolved history file, keyed by the home dir's mtime - the set
+    # of houdini version directories rarely changes between refreshes
+    _history_cache: Tuple[int, Optional[str]] = (-1, None)
+
     @staticmethod
     def get_houdini_history_file() -> Optional[str]:
         """Get the path to the Houdini file.history"""
         home = str(Path.home())
 
-        # Look for any houdini version directory
-        houdini_dirs = [d for d in os.listdir(home)
-                       if d.startswith('houdini') and
-                       os.path.isdir(os.path.join(home, d)) and
-                       not d.endswith('.py')]
+        # Reuse the cached result while the home dir is unchanged and the
+        # file still exists - skips the scandir walk, which can cost a
+        # network round trip per entry on NFS homes. A miss (None) is
+        # never cached since file.history can appear without touching ~.
+        try:
+            home_mtime = os.stat(home).st_mtime_ns
+        except OSError:
+            home_mtime = -1
+        cached_mtime, cached_file = HoudiniManager._history_cache
+        if home_mtime != -1 and cached_mtime == home_mtime \
+                and cached_file and os.path.exists(cached_file):
+            return cached_file
+
+        # Look for any houdini version directory - scandir's DirEntry
+        # caches the file type, so this avoids a stat() per entry
+        with os.scandir(home) as entries:
+            houdini_dirs = [entry.name for entry in entries
+                            if entry.name.startswith('houdini') and
+                            entry.is_dir() and
+                            not entry.name.endswith('.py')]
 
         if not houdini_dirs:
             return None
@@ -25,7 +57,11 @@ class HoudiniManager:
         latest_dir = sorted(houdini_dirs)[-1]
         history_file = os.path.join(home, latest_dir, 'file.history')
 
-        return history_file if os.path.exists(history_file) else None
+        if not os.path.exists(history_file):
+            return None
+
+        HoudiniManager._history_cache = (home_mtime, history_file)
+        return history_file
 
     @staticmethod
     def parse_hip_files(history_file: str) -> List[str]:
@@ -34,8 +70,10 @@ class HoudiniManager:
             return []
 
         try:
+            # Strip newlines in one pass with str.translate - the old
+            # splitlines+join built two full copies of the file
             with open(history_file, 'r') as f:
-                content = ''.join(f.read().splitlines())
+                content = f.read().translate(_NEWLINE_TABLE)
 
             if not content.startswith('HIP{'):
                 return []
@@ -45,29 +83,10 @@ class HoudiniManager:
                 return []
 
             hip_section = content[4:end]
-            paths = []
-            current_path = ""
-
-            for part in hip_section.split('/'):
-                if not part:
-                    continue
 
-                if not current_path:
-                    current_path = '/' + part
-                else:
-                    current_path += '/' + part
-
-                if current_path.endswith('.hip'):
-                    paths.append(current_path)
-                    current_path = ""
-
-            # Remove duplicates while preserving order
-            seen = set()
-            hip_files = []
-            for path in paths:
-                if path not in seen:
-                    seen.add(path)
-                    hip_files.append(path)
+            # Extract every path in one regex pass and dedupe while
+            # preserving order
+            hip_files = list(dict.fromkeys(_HIP_PATH_RE.findall(hip_section)))
 
             # Reverse the list so newest files appear first
             hip_files.reverse()
@@ -77,20 +96,95 @@ class HoudiniManager:
             print(f"Error reading history file: {e}")
             return []
 
+    # In-process out-node cache: hip path -> ((mtime_ns, size), nodes, settings)
+    _out_nodes_cache: Dict[str, tuple] = {}
+
+    # On-disk cache so an unchanged hip file is still instant after an
+    # application restart
+    _OUT_NODES_CACHE_DIR = Path.home() / '.cache' / 'hardeen' / 'out_nodes'
+
     @staticmethod
     def parse_out_nodes(hip_file: str) -> Tuple[List[str], Dict[str, dict]]:
-        """Parse the hip file and extract available ROP nodes and their settings"""
+        """Parse the hip file and extract available ROP nodes and their settings.
+
+        Results are cached keyed by the file's (mtime, size) - a full
+        parse means a multi-second hython startup, which is pure waste
+        when the user re-selects an unchanged hip file.
+        """
+        try:
+            st = os.stat(hip_file)
+            stamp = (st.st_mtime_ns, st.st_size)
+        except OSError:
+            stamp = None
+
+        if stamp is not None:
+            cached = HoudiniManager._out_nodes_cache.get(hip_file)
+            if cached and cached[0] == stamp:
+                # Copies, since callers mutate the node list in place
+                return list(cached[1]), dict(cached[2])
+
+            disk = HoudiniManager._read_out_nodes_cache(hip_file, stamp)
+            if disk is not None:
+                nodes, node_settings = disk
+                HoudiniManager._out_nodes_cache[hip_file] = (stamp, nodes, node_settings)
+                return list(nodes), dict(node_settings)
+
         try:
             import hou
-            return HoudiniManager._parse_out_nodes_hou(hip_file)
+            nodes, node_settings = HoudiniManager._parse_out_nodes_hou(hip_file)
         except ImportError:
-            return HoudiniManager._parse_out_nodes_hython(hip_file)
+            nodes, node_settings = HoudiniManager._parse_out_nodes_hython(hip_file)
+
+        # Only cache real results - an empty list can also mean the parse
+        # itself failed, and that shouldn't stick
+        if stamp is not None and nodes:
+            HoudiniManager._out_nodes_cache[hip_file] = (stamp, nodes, node_settings)
+            HoudiniManager._write_out_nodes_cache(hip_file, stamp, nodes, node_settings)
+
+        return nodes, node_settings
+
+    @staticmethod
+    def _out_nodes_cache_path(hip_file: str) -> Path:
+        """Cache file location for a hip file's out-node listing"""
+        digest = hashlib.sha1(hip_file.encode('utf-8')).hexdigest()
+        return HoudiniManager._OUT_NODES_CACHE_DIR / f"{digest}.json"
+
+    @staticmethod
+    def _read_out_nodes_cache(hip_file: str, stamp: tuple) -> Optional[tuple]:
+        """Load a cached out-node listing if it matches the file's stamp"""
+        try:
+            with open(HoudiniManager._out_nodes_cache_path(hip_file)) as f:
+                entry = json.load(f)
+            if (entry.get('mtime_ns'), entry.get('size')) != stamp:
+                return None
+            return entry['nodes'], entry['node_settings']
+        except (OSError, ValueError, KeyError):
+            return None
+
+    @staticmethod
+    def _write_out_nodes_cache(hip_file: str, stamp: tuple,
+                               nodes: List[str], node_settings: Dict[str, dict]):
+        """Persist an out-node listing; cache failures are non-fatal"""
+        try:
+            HoudiniManager._OUT_NODES_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            with open(HoudiniManager._out_nodes_cache_path(hip_file), 'w') as f:
+                json.dump({
+                    'mtime_ns': stamp[0],
+                    'size': stamp[1],
+                    'nodes': nodes,
+                    'node_settings': node_settings,
+                }, f)
+        except OSError as e:
+            print(f"Error writing out-node cache: {e}")
 
     @staticmethod
     def _parse_out_nodes_hou(hip_file: str) -> Tuple[List[str], Dict[str, dict]]:
         """Parse out nodes using Houdini Python API"""
         import hou
-        hou.hipFile.load(hip_file)
+        # Loading re-parses the whole scene - skip it when the requested
+        # file is already the current document
+        if os.path.abspath(hou.hipFile.path()) != os.path.abspath(hip_file):
+            hou.hipFile.load(hip_file, suppress_save_prompt=True)
 
         out_nodes = []
         node_settings = {}
@@ -98,16 +192,23 @@ class HoudiniManager:
 
         if out_context:
             for node in out_context.children():
-                if node.type().name() in ["rop_geometry", "Redshift_ROP", "opengl"]:
-                    node_path = node.path()
-                    out_nodes.append(node_path)
+                if node.type().name() not in _ROP_TYPES:
+                    continue
 
-                    settings = {
-                        'f1': int(node.parm('f1').eval()) if node.parm('f1') else 1,
-                        'f2': int(node.parm('f2').eval()) if node.parm('f2') else 1,
-                        'skip_rendered': node.parm('RS_outputSkipRendered').eval() if node.parm('RS_outputSkipRendered') else 0
-                    }
-                    node_settings[node_path] = settings
+                node_path = node.path()
+                out_nodes.append(node_path)
+
+                # Each parm() lookup crosses into the HOM C++ layer -
+                # fetch each one once instead of testing and re-fetching
+                p_f1 = node.parm('f1')
+                p_f2 = node.parm('f2')
+                p_skip = node.parm('RS_outputSkipRendered')
+                settings = {
+                    'f1': int(p_f1.eval()) if p_f1 else 1,
+                    'f2': int(p_f2.eval()) if p_f2 else 1,
+                    'skip_rendered': p_skip.eval() if p_skip else 0
+                }
+                node_settings[node_path] = settings
 
         return out_nodes, node_settings
 
@@ -120,20 +221,16 @@ import sys
 import os
 import json
 
-# Completely suppress stdout/stderr
-class NullIO:
-    def write(self, *args): pass
-    def flush(self): pass
-
-# Save original stdout/stderr
-old_stdout = sys.stdout
-old_stderr = sys.stderr
+# Redirect fds 1/2 to /dev/null at the OS level - unlike a Python-level
+# NullIO shim this also silences native printf output from Redshift and
+# adds no per-write call overhead during the load
+devnull = os.open(os.devnull, os.O_WRONLY)
+old_stdout_fd = os.dup(1)
+old_stderr_fd = os.dup(2)
+os.dup2(devnull, 1)
+os.dup2(devnull, 2)
 
 try:
-    # Redirect all output to null
-    sys.stdout = NullIO()
-    sys.stderr = NullIO()
-
     # Set environment variables to suppress Redshift output
     os.environ['RS_VERBOSITY_LEVEL'] = '0'
 
@@ -141,30 +238,39 @@ try:
     hou.hipFile.load(r"{0}", suppress_save_prompt=True)
 
     # Restore stdout just to print node paths and settings
-    sys.stdout = old_stdout
+    os.dup2(old_stdout_fd, 1)
 
     # Get out nodes and their settings
     out_context = hou.node("/out")
     node_settings = {{}}
+    ROP_TYPES = frozenset(["rop_geometry", "Redshift_ROP", "opengl"])
 
     if out_context:
         for node in out_context.children():
-            if node.type().name() in ["rop_geometry", "Redshift_ROP", "opengl"]:
+            if node.type().name() in ROP_TYPES:
                 node_path = node.path()
-                print("NODE:{{}}".format(node_path))
 
-                # Get frame range and skip settings
+                # Get frame range and skip settings, fetching each parm once
+                p_f1 = node.parm('f1')
+                p_f2 = node.parm('f2')
+                p_skip = node.parm('RS_outputSkipRendered')
                 settings = {{
-                    'f1': int(node.parm('f1').eval()) if node.parm('f1') else 1,
-                    'f2': int(node.parm('f2').eval()) if node.parm('f2') else 1,
-                    'skip_rendered': node.parm('RS_outputSkipRendered').eval() if node.parm('RS_outputSkipRendered') else 0
+                    'f1': int(p_f1.eval()) if p_f1 else 1,
+                    'f2': int(p_f2.eval()) if p_f2 else 1,
+                    'skip_rendered': p_skip.eval() if p_skip else 0
                 }}
-                print("SETTINGS:{{}}".format(json.dumps(settings)))
+
+                # One self-contained JSON object per line
+                print(json.dumps({{"node": node_path, "settings": settings}}))
 
 finally:
-    # Restore original stdout/stderr
-    sys.stdout = old_stdout
-    sys.stderr = old_stderr
+    # Restore original stdout/stderr and drop the duplicated fds
+    sys.stdout.flush()
+    os.dup2(old_stdout_fd, 1)
+    os.dup2(old_stderr_fd, 2)
+    os.close(devnull)
+    os.close(old_stdout_fd)
+    os.close(old_stderr_fd)
 """.format(hip_file)
 
         try:
@@ -183,15 +289,18 @@ finally:
             nodes = []
             node_settings = {}
 
-            current_node = None
+            # Each node arrives as one JSON object per line, so there's no
+            # NODE:/SETTINGS: pairing state to track and stray hou output
+            # is skipped by the leading-brace check
             for line in result.stdout.splitlines():
-                if line.startswith('NODE:'):
-                    current_node = line[5:].strip()
-                    nodes.append(current_node)
-                elif line.startswith('SETTINGS:'):
-                    if current_node:
-                        settings = json.loads(line[9:])
-                        node_settings[current_node] = settings
+                if not line.startswith('{'):
+                    continue
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue
+                nodes.append(entry['node'])
+                node_settings[entry['node']] = entry['settings']
 
             return nodes, node_settings
 
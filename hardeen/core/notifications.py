@@ -82,6 +82,10 @@ class NotificationManager:
 
     def __init__(self, config: NotificationConfig):
         self.config = config
+        # One session for the manager's lifetime - urllib3 keeps the
+        # connection to api.pushover.net alive, so repeated notifications
+        # skip the TCP+TLS handshake instead of paying it per call
+        self._session = requests.Session()
 
     def _convert_exr_to_png(self, exr_path: str) -> Optional[str]:
         """Convert EXR file to PNG for notification attachment"""
@@ -109,27 +113,22 @@ class NotificationManager:
             print(f"Error converting EXR to PNG: {str(e)}")
             return None
 
-    def _prepare_image_attachment(self, image_path: Optional[str]) -> Optional[Dict[str, Any]]:
-        """Prepare image attachment for notification"""
+    def _prepare_image_attachment(self, image_path: Optional[str]) -> tuple:
+        """Resolve the file to attach, converting EXR frames to PNG.
+
+        Returns:
+            Tuple of (path, is_temp) where is_temp marks a converted PNG
+            that the caller must delete after the upload. Never flags a
+            caller-supplied file for deletion.
+        """
         if not image_path or not os.path.exists(image_path):
-            return None
+            return None, False
 
-        try:
-            # Convert EXR to PNG if needed
-            if image_path.lower().endswith('.exr'):
-                png_path = self._convert_exr_to_png(image_path)
-                if not png_path:
-                    return None
-                image_path = png_path
-
-            # Return attachment configuration
-            return {
-                "attachment": ("render.png", open(image_path, "rb"), "image/png")
-            }
+        if image_path.lower().endswith('.exr'):
+            png_path = self._convert_exr_to_png(image_path)
+            return png_path, png_path is not None
 
-        except Exception as e:
-            print(f"Error preparing image attachment: {str(e)}")
-            return None
+        return image_path, False
 
     def send_push_notification(self, message: str, image_path: Optional[str] = None) -> Dict[str, Any]:
         """
@@ -213,12 +212,21 @@ class NotificationManager:
         # Add any additional parameters
         data.update(kwargs)
 
+        attach_path = None
+        is_temp = False
         try:
             # Prepare image attachment if provided
-            files = self._prepare_image_attachment(image_path) if image_path else {}
-
-            # Send notification
-            response = requests.post(self.PUSHOVER_API_URL, data=data, files=files)
+            if image_path:
+                attach_path, is_temp = self._prepare_image_attachment(image_path)
+
+            # Send notification, keeping the attachment handle in a with
+            # block so the descriptor is closed even if the post fails
+            if attach_path:
+                with open(attach_path, "rb") as attachment:
+                    files = {"attachment": ("render.png", attachment, "image/png")}
+                    response = self._session.post(self.PUSHOVER_API_URL, data=data, files=files, timeout=30)
+            else:
+                response = self._session.post(self.PUSHOVER_API_URL, data=data, timeout=30)
             response.raise_for_status()
             return response.json()
 
@@ -231,10 +239,11 @@ class NotificationManager:
             print(f"Unexpected error sending notification: {error_msg}")
             return {"status": 0, "error": error_msg}
         finally:
-            # Clean up any temporary files
-            if image_path and image_path.endswith('.png') and os.path.exists(image_path):
+            # Delete only the temp PNG created for an EXR conversion,
+            # never a caller-supplied image
+            if is_temp and attach_path and os.path.exists(attach_path):
                 try:
-                    os.unlink(image_path)
+                    os.unlink(attach_path)
                 except Exception as e:
                     print(f"Error cleaning up temporary file: {str(e)}")
 
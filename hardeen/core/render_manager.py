@@ -1,12 +1,28 @@
 import os
+import re
 import signal
 import subprocess
 import threading
 import time
 import datetime
+from collections import deque
+from multiprocessing import shared_memory
 from pathlib import Path
 from typing import List, Dict, Tuple, Optional, Callable, Any
 
+# Patterns matched against every line of hython output during a render -
+# compiled once at import so the monitor loop doesn't hit the re cache
+# per line
+_SAVED_FILE_RE = re.compile(r"Saved file ['\"]([^'\"]+\.(?:exr|png|jpg|jpeg|tif|tiff))['\"]")
+_FRAME_RANGE_RE = re.compile(r"Frame range: (\d+)-(\d+)")
+_FRAME_ARGS_RE = re.compile(r"-s (\d+) -e (\d+)")
+_ROP_RANGE_RE = re.compile(r"ROP.*f1:(\d+).*f2:(\d+)")
+_FRAME_ARGS_LOOSE_RE = re.compile(r"-s (\d+).*-e (\d+)")
+_STEP_ARG_RE = re.compile(r"-t (\d+)")
+_RENDERING_FRAME_RE = re.compile(r"'([^']+)' rendering frame (\d+)")
+_BLOCK_RE = re.compile(r"Block (\d+)/(\d+)")
+_RENDER_TIME_RE = re.compile(r"total time (\d+\.\d+) sec")
+
 class RenderManager:
     """Manages the rendering process for Houdini files"""
 
@@ -17,6 +33,7 @@ class RenderManager:
         self.killed = False
         self.render_start_time = None
         self._initial_frame_total = 0
+        self._stop_shm = None
 
         # Callback to update UI
         self.output_callback = None
@@ -71,6 +88,13 @@ from optparse import OptionParser
 # Global flag to indicate if we should stop rendering
 STOP_RENDERING = False
 
+# Shared-memory stop flag set by the GUI - polled before each frame so a
+# stop request needs no signal delivery
+STOP_SHM = None
+
+def should_stop():
+    return STOP_RENDERING or (STOP_SHM is not None and STOP_SHM.buf[0])
+
 # Signal handler for graceful shutdown
 def signal_handler(sig, frame):
     global STOP_RENDERING
@@ -95,6 +119,10 @@ def initRender(out, sframe, eframe, userange, useskip, step=1):
         rnode.parm('prerender').set('Redshift_setLogLevel -L 5')
 
     def dataHelper(rop_node, render_event_type, frame):
+        if render_event_type == hou.ropRenderEventType.PreFrame and should_stop():
+            # Abort the batched render before the next frame starts
+            print("Interrupt detected - stopping render after current frame.")
+            raise hou.OperationInterrupted()
         if render_event_type == hou.ropRenderEventType.PostFrame:
             output_file = rnode.evalParm("RS_outputFileNamePrefix")
             print(f"hardeen_outputfile: {output_file}")
@@ -117,22 +145,23 @@ def initRender(out, sframe, eframe, userange, useskip, step=1):
                   "Defaulting to the frame range that was set from within Houdini for each ROP.")
     else:
         if userange == "True":
-            # Create a list of frames to render based on step
-            frames = list(range(int(sframe), int(eframe) + 1, int(step)))
+            # Stepped frame range to render - a range object is enough,
+            # only the first and last frames are read from it
+            frames = range(int(sframe), int(eframe) + 1, int(step))
 
             # Set the frame range parameters to match our actual frame list
             rnode.parm("f1").set(frames[0])  # First frame in our list
             rnode.parm("f2").set(frames[-1])  # Last frame in our list
             rnode.parm("f3").set(int(step))  # Set frame step
 
-            # Render each frame individually to ensure proper stepping
-            for frame in frames:
-                # Check if we should stop rendering
-                if STOP_RENDERING:
-                    print("Interrupt detected - stopping render after current frame.")
-                    break
-
-                rnode.render(frame_range=(frame, frame))
+            # Render the whole stepped range in one call so Houdini only
+            # sets up the render once and Redshift can reuse its scene
+            # cache between frames. Interrupts are handled by the PreFrame
+            # callback raising hou.OperationInterrupted.
+            try:
+                rnode.render(frame_range=(frames[0], frames[-1], int(step)))
+            except hou.OperationInterrupted:
+                print("Render stopped after interrupt.")
         else:
             rnode.render(frame_range=(rnode.parm("f1").eval(), rnode.parm("f2").eval()))
 
@@ -145,9 +174,18 @@ if __name__ == "__main__":
     parser.add_option("-u", "--userange", dest="userange", help="toggle to enable frame range")
     parser.add_option("-r", "--useskip", dest="useskip", help="toggle to skip rendering of already rendered frames")
     parser.add_option("-t", "--step", dest="step", help="render every Nth frame", default="1")
+    parser.add_option("-f", "--stopflag", dest="stopflag", help="name of shared memory stop flag", default=None)
 
     (options, args) = parser.parse_args()
 
+    # Attach to the GUI's shared-memory stop flag if one was provided
+    if options.stopflag:
+        try:
+            from multiprocessing import shared_memory
+            STOP_SHM = shared_memory.SharedMemory(name=options.stopflag)
+        except Exception as e:
+            print(f"Could not attach stop flag '{options.stopflag}': {e}")
+
     # Convert hip file path to absolute and verify it exists
     hip_file = os.path.abspath(options.hipfile.strip())  # Strip whitespace and newlines
     hip_dir = os.path.dirname(hip_file)
@@ -207,7 +245,14 @@ if __name__ == "__main__":
 
     def start_render(self, hip_path: str, out_path: str, start_frame: int, end_frame: int,
                     use_range: bool, use_skip: bool, frame_step: int = 1):
-        """Start the render process"""
+        """Start the render process
+
+        Deliberately a single hython subprocess: Redshift saturates the
+        GPU per frame, so fanning frames out across worker processes
+        would thrash VRAM and licenses rather than add throughput. The
+        monitor loop, progress UI and interrupt handling all assume one
+        linear frame sequence on one process.
+        """
         if self.process:
             return False  # Already rendering
 
@@ -225,6 +270,16 @@ if __name__ == "__main__":
         # Create the temp Python file
         temp_file = self.create_temp_python_file()
 
+        # Create a one-byte shared-memory stop flag the subprocess polls
+        # before each frame - interrupting becomes a memory write instead
+        # of a signal round-trip
+        try:
+            self._stop_shm = shared_memory.SharedMemory(
+                create=True, size=1, name=f'hardeen_stop_{os.getpid()}')
+            self._stop_shm.buf[0] = 0
+        except Exception:
+            self._stop_shm = None  # Fall back to SIGUSR1 signalling
+
         # Build command list
         cmd = [
             'hython',
@@ -237,6 +292,8 @@ if __name__ == "__main__":
             '-r', str(use_skip),
             '-t', str(frame_step)
         ]
+        if self._stop_shm is not None:
+            cmd += ['-f', self._stop_shm.name]
 
         # Start process
         self.process = subprocess.Popen(
@@ -285,7 +342,13 @@ if __name__ == "__main__":
                 center=True
             )
 
-        # Send SIGUSR1 signal to indicate graceful shutdown
+        # Set the shared-memory stop flag; the subprocess checks it before
+        # each frame starts
+        if self._stop_shm is not None:
+            self._stop_shm.buf[0] = 1
+            return True
+
+        # Fall back to SIGUSR1 if the flag couldn't be created
         try:
             os.kill(self.process.pid, signal.SIGUSR1)
         except (AttributeError, ProcessLookupError):
@@ -335,8 +398,7 @@ if __name__ == "__main__":
 
     def _monitor_render(self):
         """Monitor the render process and emit signals as needed"""
-        import re
-        import select
+        import selectors
 
         try:
             # Initialize variables for tracking render progress
@@ -366,14 +428,17 @@ if __name__ == "__main__":
             # Initialize variables for tracking frames
             frames_seen = set()
             skipped_frames = set()
-            consecutive_skips = []
+            consecutive_skips = []  # [start, end] skip ranges, built in order
 
             # Dictionary to track frame render start times
             frame_start_times = {}
 
-            # Variables for block tracking
-            completed_blocks = set()
+            # Variables for block tracking - a packed bitset plus a count
+            # instead of a set of ints, since block indices are dense
+            completed_blocks = bytearray()
+            completed_block_count = 0
             total_blocks = None
+            last_progress_percent = -1
             last_message_type = None
 
             # Do an initial time update to show "0/0" as frame count and 0s for times
@@ -394,9 +459,25 @@ if __name__ == "__main__":
                     False               # Don't show ETA yet
                 )
 
-            while self.process and self.process.poll() is None:
-                # Add timeout to readline to allow checking cancellation
-                ready = select.select([self.process.stdout], [], [], 0.1)[0]
+            # Register the pipe once with the platform's best polling
+            # mechanism (epoll on Linux) instead of rebuilding a select()
+            # fd set on every iteration
+            selector = selectors.DefaultSelector()
+            selector.register(self.process.stdout, selectors.EVENT_READ)
+
+            # Read the pipe in large chunks and split lines off a rolling
+            # bytes buffer - one syscall can deliver dozens of lines
+            # instead of one readline call per line
+            stdout_fd = self.process.stdout.fileno()
+            read_buf = bytearray()
+            pending_lines = deque()
+
+            # Keep draining queued lines even after the process exits so a
+            # final burst of output isn't dropped
+            while self.process and (pending_lines or self.process.poll() is None):
+                # Poll with a timeout so cancellation can be checked; don't
+                # block when lines are already waiting to be processed
+                ready = selector.select(0 if pending_lines else 0.1)
 
                 # Check if we need to update elapsed time (every 500ms)
                 current_time = datetime.datetime.now()
@@ -459,30 +540,54 @@ if __name__ == "__main__":
                     # Record last update time
                     last_time_update = current_time
 
-                if not ready:
+                if ready:
+                    chunk = os.read(stdout_fd, 65536)
+                    if chunk:
+                        read_buf += chunk
+                        if b'\n' in chunk:
+                            complete = read_buf.split(b'\n')
+                            read_buf = bytearray(complete.pop())
+                            pending_lines.extend(complete)
+                    else:
+                        # EOF - flush any unterminated tail and drain
+                        # what's already queued
+                        if read_buf:
+                            pending_lines.append(bytes(read_buf))
+                            read_buf = bytearray()
+                        if not pending_lines:
+                            break
+
+                if not pending_lines:
                     if self.canceling and not current_frame_in_progress:
                         break
                     elif self.canceling and not graceful_shutdown_requested:
-                        try:
-                            os.kill(self.process.pid, signal.SIGUSR1)
+                        if self._stop_shm is not None:
+                            self._stop_shm.buf[0] = 1
                             graceful_shutdown_requested = True
-                        except (AttributeError, ProcessLookupError):
-                            pass
+                        else:
+                            try:
+                                os.kill(self.process.pid, signal.SIGUSR1)
+                                graceful_shutdown_requested = True
+                            except (AttributeError, ProcessLookupError):
+                                pass
                     continue
 
-                line = self.process.stdout.readline()
-                if not line:
-                    break
-
-                line = line.decode(errors='backslashreplace').rstrip()
-                line = line.replace('[Redshift] ', '').replace('[Redshift]', '')
+                line = pending_lines.popleft().decode(errors='backslashreplace').rstrip()
+                # Strip the Redshift tag only when present - the unguarded
+                # replace pair allocated two new strings for every line,
+                # tagged or not
+                if '[Redshift]' in line:
+                    line = line.replace('[Redshift] ', '').replace('[Redshift]', '')
 
                 # Emit raw output signal
                 if self.raw_output_callback:
                     self.raw_output_callback(line)
 
-                # Check for saved file messages
-                saved_file_match = re.search(r"Saved file ['\"]([^'\"]+\.(?:exr|png|jpg|jpeg|tif|tiff))['\"]", line)
+                # Check for saved file messages. Each regex below is
+                # guarded by a plain substring test - most lines match
+                # none of the patterns, and `in` rejects them for a
+                # fraction of the cost of running the regex engine
+                saved_file_match = _SAVED_FILE_RE.search(line) if 'Saved file' in line else None
                 if saved_file_match:
                     output_file = saved_file_match.group(1)
                     # Emit image update signal
@@ -493,19 +598,20 @@ if __name__ == "__main__":
                 frame_range_match = None
 
                 # Pattern 1: Standard "Frame range: X-Y" format
-                pattern1 = re.search(r"Frame range: (\d+)-(\d+)", line)
-                if pattern1:
-                    frame_range_match = pattern1
+                if 'Frame range:' in line:
+                    pattern1 = _FRAME_RANGE_RE.search(line)
+                    if pattern1:
+                        frame_range_match = pattern1
 
                 # Pattern 2: Try to match the actual start and end frame from the command
                 if not frame_range_match and "hip file" in line.lower():
-                    pattern2 = re.search(r"-s (\d+) -e (\d+)", line)
+                    pattern2 = _FRAME_ARGS_RE.search(line)
                     if pattern2:
                         frame_range_match = pattern2
 
                 # Pattern 3: Look for ROP output with frame range info
-                if not frame_range_match:
-                    pattern3 = re.search(r"ROP.*f1:(\d+).*f2:(\d+)", line)
+                if not frame_range_match and 'ROP' in line:
+                    pattern3 = _ROP_RANGE_RE.search(line)
                     if pattern3:
                         frame_range_match = pattern3
 
@@ -520,11 +626,12 @@ if __name__ == "__main__":
 
                     # Now that we have frame_total, do an initial estimate
                     if self.time_labels_callback:
-                        elapsed_time = (datetime.datetime.now() - start_time).total_seconds()
+                        now = datetime.datetime.now()
+                        elapsed_time = (now - start_time).total_seconds()
                         # Initial guess: 5 seconds per frame if we have no data yet
                         est_total_time = 5.0 * frame_total
                         remaining_time = est_total_time - elapsed_time
-                        eta_time = datetime.datetime.now() + datetime.timedelta(seconds=remaining_time)
+                        eta_time = now + datetime.timedelta(seconds=remaining_time)
                         last_eta_time = eta_time  # Store this initial ETA
 
                         self.time_labels_callback(
@@ -538,14 +645,14 @@ if __name__ == "__main__":
 
                 # Fallback: If we still have no frame_total but have command line arguments
                 if frame_total == 0 and "-s" in line and "-e" in line and not frame_total_from_args:
-                    frame_arg_match = re.search(r"-s (\d+).*-e (\d+)", line)
+                    frame_arg_match = _FRAME_ARGS_LOOSE_RE.search(line)
                     if frame_arg_match:
                         start_frame = int(frame_arg_match.group(1))
                         end_frame = int(frame_arg_match.group(2))
                         step = 1
 
                         # Try to find step size
-                        step_match = re.search(r"-t (\d+)", line)
+                        step_match = _STEP_ARG_RE.search(line)
                         if step_match:
                             step = int(step_match.group(1))
 
@@ -560,12 +667,12 @@ if __name__ == "__main__":
                         frame_total_from_args = True
 
                 # Track when a frame is about to be rendered
-                frame_rendering_match = re.search(r"'([^']+)' rendering frame (\d+)", line)
+                frame_rendering_match = _RENDERING_FRAME_RE.search(line) if 'rendering frame' in line else None
                 if frame_rendering_match:
                     current_frame_number = int(frame_rendering_match.group(2))
                     # Store the start time for this frame
-                    frame_start_times[current_frame_number] = datetime.datetime.now()
-                    current_frame_start_time = datetime.datetime.now()  # For tracking current frame
+                    current_frame_start_time = datetime.datetime.now()
+                    frame_start_times[current_frame_number] = current_frame_start_time
 
                     # Fallback: If we still haven't detected a frame range but have seen a frame number,
                     # at least update the total frames to something greater than the current frame
@@ -589,7 +696,13 @@ if __name__ == "__main__":
                         if self.frame_skipped_callback:
                             self.frame_skipped_callback(current_frame_number)
 
-                        consecutive_skips.append(current_frame_number)
+                        # Extend the current skip range or open a new one -
+                        # frames are discovered in render order, so the
+                        # ranges come out coalesced without a final sort
+                        if consecutive_skips and current_frame_number == consecutive_skips[-1][1] + 1:
+                            consecutive_skips[-1][1] = current_frame_number
+                        else:
+                            consecutive_skips.append([current_frame_number, current_frame_number])
 
                         # Update UI with skipped frame
                         if self.progress_callback:
@@ -685,12 +798,28 @@ if __name__ == "__main__":
                         break
 
                 # Check for Redshift block progress
-                block_match = re.search(r'Block (\d+)/(\d+)', line)
+                block_match = _BLOCK_RE.search(line) if 'Block ' in line else None
                 if block_match and current_frame_number is not None:
                     block_num = int(block_match.group(1))
-                    total_blocks = int(block_match.group(2))
-                    completed_blocks.add(block_num)
-                    percent = int((len(completed_blocks) / total_blocks) * 100)
+                    new_total = int(block_match.group(2))
+                    if new_total != total_blocks:
+                        # Block numbers are 1-based, so size for index total
+                        total_blocks = new_total
+                        completed_blocks = bytearray((total_blocks + 8) >> 3)
+                        completed_block_count = 0
+                    byte_index, bit = divmod(block_num, 8)
+                    mask = 1 << bit
+                    if byte_index < len(completed_blocks) and not completed_blocks[byte_index] & mask:
+                        completed_blocks[byte_index] |= mask
+                        completed_block_count += 1
+                    percent = int((completed_block_count / total_blocks) * 100)
+
+                    # Redshift logs many block lines per percentage point;
+                    # only cross the thread boundary when the visible value
+                    # actually moves, which caps emissions at ~100 per frame
+                    if percent == last_progress_percent:
+                        continue
+                    last_progress_percent = percent
 
                     # Emit frame progress signal
                     if self.frame_progress_callback:
@@ -698,7 +827,8 @@ if __name__ == "__main__":
 
                     # Even for partial frame progress, update time estimates
                     if frame_total > 0 and current_frame_start_time and self.time_labels_callback:
-                        elapsed_time = (datetime.datetime.now() - start_time).total_seconds()
+                        now = datetime.datetime.now()
+                        elapsed_time = (now - start_time).total_seconds()
 
                         if average > 0:
                             # Use known average for remaining frames
@@ -712,7 +842,7 @@ if __name__ == "__main__":
                         else:
                             # Very rough estimate based on current progress of first frame
                             if percent > 0:
-                                time_per_percent = (datetime.datetime.now() - current_frame_start_time).total_seconds() / percent
+                                time_per_percent = (now - current_frame_start_time).total_seconds() / percent
                                 current_frame_remaining = time_per_percent * (100 - percent)
                                 remaining_time = current_frame_remaining + (frame_total - 1) * (time_per_percent * 100)
                             else:
@@ -720,7 +850,7 @@ if __name__ == "__main__":
                                 remaining_time = frame_total * 5.0  # Assume 5 seconds per frame
 
                         est_total_time = elapsed_time + remaining_time
-                        eta_time = datetime.datetime.now() + datetime.timedelta(seconds=remaining_time)
+                        eta_time = now + datetime.timedelta(seconds=remaining_time)
                         last_eta_time = eta_time  # Store this valid ETA
 
                         self.time_labels_callback(
@@ -736,7 +866,7 @@ if __name__ == "__main__":
                 elif 'scene extraction time' in line:
                     if current_frame_start and current_frame_number is not None:
                         # Extract render time
-                        match = re.search(r"total time (\d+\.\d+) sec", line)
+                        match = _RENDER_TIME_RE.search(line)
                         if match:
                             render_time = float(match.group(1))
                             frame_times.append(render_time)
@@ -798,8 +928,10 @@ if __name__ == "__main__":
                             last_message_type = "completed"
 
                             # Clear block tracking at end of frame
-                            completed_blocks = set()
+                            completed_blocks = bytearray()
+                            completed_block_count = 0
                             total_blocks = None
+                            last_progress_percent = -1
 
                 # Check for special hardeen messages
                 if line.startswith('hardeen_outputfile:'):
@@ -807,27 +939,12 @@ if __name__ == "__main__":
                     if self.image_update_callback:
                         self.image_update_callback(output_file)
 
+            selector.close()
+
             # Output any remaining skipped frames at the end
             if consecutive_skips and self.output_callback:
-                consecutive_skips.sort()
-                ranges = []
-                start = end = consecutive_skips[0]
-
-                for i in range(1, len(consecutive_skips)):
-                    if consecutive_skips[i] == end + 1:
-                        end = consecutive_skips[i]
-                    else:
-                        if start == end:
-                            ranges.append(f"{start}")
-                        else:
-                            ranges.append(f"{start}-{end}")
-                        start = end = consecutive_skips[i]
-
-                if start == end:
-                    ranges.append(f"{start}")
-                else:
-                    ranges.append(f"{start}-{end}")
-
+                ranges = [f"{start}" if start == end else f"{start}-{end}"
+                          for start, end in consecutive_skips]
                 frames_text = ", ".join(ranges)
                 self.output_callback(f"Frames {frames_text} skipped - Files already exist\n\n")
 
@@ -851,6 +968,8 @@ if __name__ == "__main__":
                     False          # Don't show ETA anymore
                 )
 
+            self._release_stop_flag()
+
             # Signal render finished when done
             if self.render_finished_callback:
                 self.render_finished_callback()
@@ -858,18 +977,31 @@ if __name__ == "__main__":
         except Exception as e:
             import traceback
             print(f"Error in monitor thread: {str(e)}\n{traceback.format_exc()}")
+            self._release_stop_flag()
             if self.render_finished_callback:
                 self.render_finished_callback()
 
+    def _release_stop_flag(self):
+        """Close and unlink the shared-memory stop flag if one exists"""
+        if self._stop_shm is None:
+            return
+        try:
+            self._stop_shm.close()
+            self._stop_shm.unlink()
+        except Exception:
+            pass  # Already released
+        self._stop_shm = None
+
     def is_rendering(self) -> bool:
         """Check if rendering is in progress"""
         return self.process is not None and self.process.poll() is None
 
     def _format_time(self, seconds: float) -> str:
         """Format seconds into human readable time"""
-        timedelta = datetime.timedelta(seconds=seconds)
-        days = timedelta.days
-        hours, remainder = divmod(timedelta.seconds, 3600)
+        # Pure integer math - no point building a timedelta just to
+        # decompose it again
+        days, remainder = divmod(int(seconds), 86400)
+        hours, remainder = divmod(remainder, 3600)
         minutes, seconds = divmod(remainder, 60)
         parts = []
         if days:
@@ -7,7 +7,7 @@ import traceback
 from pathlib import Path
 from typing import Optional, Dict, Any
 from PySide6.QtWidgets import (
-    QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QFormLayout,
+    QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QPushButton, QLabel, QComboBox, QSpinBox, QCheckBox, QLineEdit, QGroupBox,
     QProgressBar, QMessageBox, QFileDialog, QFrame, QSplitter, QTextEdit, QDialog,
     QApplication, QSizePolicy
@@ -40,7 +40,6 @@ from ..config import (
     DEFAULT_FOLDER, DEFAULT_OUTNODE, DEFAULT_LOG,
     APP_NAME, APP_ORGANIZATION, APP_VERSION
 )
-from ..utils.image_utils import load_exr_aovs
 
 class Hardeen(QMainWindow):
     """Main window for the Houdini render manager"""
@@ -58,8 +57,6 @@ class Hardeen(QMainWindow):
         palette.setColor(QPalette.ColorRole.ToolTipBase, QColor("#232323"))  # dark background
         palette.setColor(QPalette.ColorRole.ToolTipText, QColor("#ffffff"))  # white text
         QApplication.setPalette(palette)
-        app = QApplication.instance()
-        app.setStyleSheet(app.styleSheet() + "\nQToolTip { color: #fff; background-color: #232323; border: 1px solid #444; padding: 6px 10px; }")
 
         # Initialize managers
         self.render_manager = RenderManager()
@@ -67,9 +64,6 @@ class Hardeen(QMainWindow):
         self.notification_ui_manager = NotificationUIManager(self.settings_manager, self)
         self.notification_settings = self.settings_manager.get_notification_settings()
 
-        # Signal connection flags
-        self.out_node_signal_connected = False
-
         # Hip file manager will be initialized after UI setup
         self.hip_file_manager = None
 
@@ -108,7 +102,9 @@ class Hardeen(QMainWindow):
         self._save_settings_timer.setInterval(300)  # 300ms debounce
         self._save_settings_timer.timeout.connect(self._debounced_save_settings)
 
-        # Setup UI
+        # Setup UI - freeze updates for the whole widget-tree build so the
+        # dozens of addWidget/addLayout calls collapse into one layout pass
+        self.setUpdatesEnabled(False)
         self.setWindowTitle(f"{APP_NAME} v{APP_VERSION}")
         self.setup_ui()
 
@@ -185,6 +181,7 @@ class Hardeen(QMainWindow):
         # Connect UI signal handlers for hip file operations
         # Important: Only connect after setting loading state to prevent auto-refresh
         self.hip_input.currentTextChanged.connect(self.hip_file_manager.on_hip_file_changed)
+        self.out_input.currentTextChanged.connect(self.on_out_node_changed)
         self.hip_browse_btn.clicked.connect(self.hip_file_manager.browse_hip_file)
         self.hip_refresh_btn.clicked.connect(self.hip_file_manager.load_hip_files)
         self.out_refresh_btn.clicked.connect(self.hip_file_manager.refresh_out_nodes)
@@ -221,6 +218,9 @@ class Hardeen(QMainWindow):
         self.image_handler.output_callback = self.append_output_safe
         self.image_handler.raw_output_callback = self.append_raw_output_safe
 
+        # Construction and settings load are done - allow painting again
+        self.setUpdatesEnabled(True)
+
         # Now that loading is complete, do a single refresh of out nodes if a hip file is selected
         # This is the only place where we explicitly call refresh_out_nodes during initialization
         if self.hip_input.currentText():
@@ -534,8 +534,8 @@ class Hardeen(QMainWindow):
                     status_total = self.render_status.total_frames
 
                     # Update frame count display
-                    self.fc_value.setText(str(current))
-                    self.tfc_value.setText(str(status_total))
+                    self._set_stat_text(self.fc_value, str(current))
+                    self._set_stat_text(self.tfc_value, str(status_total))
 
                     # Update the progress frame with the total frames
                     if total != self.progress_frame.total_frames:
@@ -690,6 +690,18 @@ class Hardeen(QMainWindow):
             raw_output_callback=self.append_raw_output_safe
         )
 
+    @staticmethod
+    def _set_stat_text(label, text):
+        """Set a stats label's text only if it changed.
+
+        The stats row is refreshed twice a second during renders, but most
+        values (average, estimated total, frame counts) only change when a
+        frame completes. Skipping identical text avoids a label relayout
+        and repaint for every unchanged stat on every tick.
+        """
+        if label.text() != text:
+            label.setText(text)
+
     def update_time_labels(self, elapsed, average, total, remaining, eta, show_eta):
         """Update the time labels with current render statistics"""
         # Format all times as human-readable strings
@@ -699,18 +711,18 @@ class Hardeen(QMainWindow):
         remaining_str = format_time(remaining)
 
         # Update all the time-related labels
-        self.elapsed_value.setText(elapsed_str)
-        self.average_value.setText(avg_str)
-        self.total_value.setText(total_str)
-        self.remaining_value.setText(remaining_str)
+        self._set_stat_text(self.elapsed_value, elapsed_str)
+        self._set_stat_text(self.average_value, avg_str)
+        self._set_stat_text(self.total_value, total_str)
+        self._set_stat_text(self.remaining_value, remaining_str)
 
         # Update ETA display based on the provided datetime
         if show_eta and eta.isValid():
-            self.eta_value.setText(eta.toString("hh:mm:ss"))
+            self._set_stat_text(self.eta_value, eta.toString("hh:mm:ss"))
             self.eta_label.setEnabled(True)
             self.eta_value.setEnabled(True)
         else:
-            self.eta_value.setText("--:--:--")
+            self._set_stat_text(self.eta_value, "--:--:--")
             self.eta_label.setEnabled(False)
             self.eta_value.setEnabled(False)
 
@@ -756,13 +768,6 @@ class Hardeen(QMainWindow):
 
     def on_out_nodes_loaded(self, out_nodes, node_settings):
         """Handle when out nodes are loaded by the hip file manager"""
-        # Connect to the out_input's currentTextChanged signal if not already connected
-        if not hasattr(self, 'out_node_signal_connected') or not self.out_node_signal_connected:
-            # Safely check if signal is already connected without trying to disconnect
-            # This avoids the disconnect warning when the signal isn't connected yet
-            self.out_input.currentTextChanged.connect(self.on_out_node_changed)
-            self.out_node_signal_connected = True
-
         # Check if we need to update our frame range and skip settings based on the
         # selected node (only if we're not overriding with custom range)
         if out_nodes:
@@ -1,7 +1,7 @@
 import os
 from typing import Optional, Dict, Any, Callable
 import datetime
-from PySide6.QtCore import QObject, Signal
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal
 from PySide6.QtWidgets import QMessageBox
 
 from ..core.notifications import (
@@ -12,6 +12,34 @@ from ..core.notifications import (
 )
 from ..utils.time_utils import format_time
 
+class NotificationSendWorker(QRunnable):
+    """
+    Runnable that performs a Pushover send off the GUI thread.
+    The EXR->PNG conversion and the HTTPS post can each take seconds for
+    a multi-MB frame; the API result is delivered back via a queued
+    signal so the UI never stalls on a notification.
+    """
+
+    class Signals(QObject):
+        finished = Signal(dict)  # Pushover API response
+
+    def __init__(self, manager: NotificationManager, title: str, message: str,
+                 image_path: Optional[str]):
+        super().__init__()
+        self.manager = manager
+        self.title = title
+        self.message = message
+        self.image_path = image_path
+        self.signals = NotificationSendWorker.Signals()
+
+    def run(self):
+        result = self.manager.send_notification(
+            title=self.title,
+            message=self.message,
+            image_path=self.image_path
+        )
+        self.signals.finished.emit(result or {})
+
 class NotificationUIManager(QObject):
     """
     Manages the UI integration with the notification system.
@@ -66,37 +94,32 @@ class NotificationUIManager(QObject):
             self.notification_sent.emit(False, "Notification manager not available")
             return
 
-        try:
-            result = self.notification_manager.send_notification(
-                title=title,
-                message=message,
-                image_path=image_path
-            )
+        # Run the send (including any EXR->PNG conversion) on the thread
+        # pool; the result handler runs back on the GUI thread
+        worker = NotificationSendWorker(self.notification_manager, title, message, image_path)
+        worker.signals.finished.connect(
+            lambda result: self._on_notification_result(result, output_callback)
+        )
+        QThreadPool.globalInstance().start(worker)
 
-            if result.get("status") != 1:
-                error_msg = result.get("error", "Unknown error")
-                print(f"Failed to send notification: {error_msg}")
-                if output_callback:
-                    output_callback(
-                        f"\nNotification failed: {error_msg}\n",
-                        color='#ff6666',
-                        bold=True
-                    )
-                self.notification_sent.emit(False, error_msg)
-            else:
-                # Success - only log to console but don't output to UI
-                print("Notification sent successfully")
-                # Signal that notification was sent successfully
-                self.notification_sent.emit(True, "Notification sent successfully")
-        except Exception as e:
-            print(f"Error sending notification: {str(e)}")
+    def _on_notification_result(self, result: Dict[str, Any],
+                                output_callback: Optional[Callable] = None):
+        """Handle a worker's Pushover API response on the GUI thread"""
+        if result.get("status") != 1:
+            error_msg = result.get("error", "Unknown error")
+            print(f"Failed to send notification: {error_msg}")
             if output_callback:
                 output_callback(
-                    f"\nError sending notification: {str(e)}\n",
+                    f"\nNotification failed: {error_msg}\n",
                     color='#ff6666',
                     bold=True
                 )
-            self.notification_sent.emit(False, str(e))
+            self.notification_sent.emit(False, error_msg)
+        else:
+            # Success - only log to console but don't output to UI
+            print("Notification sent successfully")
+            # Signal that notification was sent successfully
+            self.notification_sent.emit(True, "Notification sent successfully")
 
     def send_push_notification(self, message: str, image_path: Optional[str] = None,
                               output_callback: Optional[Callable] = None):
@@ -10,7 +10,7 @@ from ..core.notifications import (
     NotificationSettings
 )
 from ..utils.settings import Settings
-from ..config import DEFAULT_FOLDER, DEFAULT_OUTNODE, SHUTDOWN_DELAYS
+from ..config import DEFAULT_FOLDER, DEFAULT_OUTNODE, SHUTDOWN_DELAYS, SHUTDOWN_DELAY_SECONDS
 from ..gui.ui_components import get_ui_shutdown_delay
 
 # Map UI display formats back to config values
@@ -162,6 +162,11 @@ class SettingsManager(QObject):
 
     def save_settings(self, ui):
         """Save current UI state to settings"""
+        # Belt-and-braces: programmatic field updates during load_settings
+        # must not rewrite the store we're in the middle of reading
+        if self._loading_settings:
+            return
+
         # Save hip and out node selections
         self.settings.set('last_hipname', ui.hip_input.currentText())
         self.settings.set('outnames', self._get_unique_items(ui.out_input))
@@ -202,8 +207,10 @@ class SettingsManager(QObject):
         self.settings_changed.emit()
 
     def _get_unique_items(self, combo):
-        """Helper to get unique items from QComboBox"""
-        return list(set(combo.itemText(i) for i in range(combo.count())))
+        """Helper to get unique items from QComboBox, preserving item order"""
+        # dict.fromkeys de-dups without scrambling the dropdown's history
+        # order the way list(set(...)) did
+        return list(dict.fromkeys(combo.itemText(i) for i in range(combo.count())))
 
     def update_notification_manager(self):
         """Update notification manager with current settings"""
@@ -393,18 +400,4 @@ class SettingsManager(QObject):
     def get_shutdown_delay_seconds(self):
         """Convert the selected delay option to seconds"""
         delay_text = self.get('shutdown_delay', 'No delay')
-
-        if delay_text == "No delay":
-            return 5  # Minimal delay for safety
-        elif delay_text == "1 minute":
-            return 60
-        elif delay_text == "5 minutes":
-            return 5 * 60
-        elif delay_text == "10 minutes":
-            return 10 * 60
-        elif delay_text == "30 minutes":
-            return 30 * 60
-        elif delay_text == "1 hour":
-            return 60 * 60
-        else:
-            return 5  # Default minimal delay
+        return SHUTDOWN_DELAY_SECONDS.get(delay_text, 5)
@@ -1,9 +1,10 @@
 import os
+from functools import lru_cache
 from PySide6.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QFormLayout,
+    QWidget, QVBoxLayout, QHBoxLayout,
     QPushButton, QLabel, QComboBox, QSpinBox, QCheckBox, QLineEdit, QGroupBox,
-    QProgressBar, QMessageBox, QFileDialog, QFrame, QSplitter, QTextEdit, QDialog,
-    QApplication, QSizePolicy
+    QProgressBar, QMessageBox, QFileDialog, QFrame, QSplitter, QTextEdit,
+    QPlainTextEdit, QDialog, QApplication, QSizePolicy
 )
 from PySide6.QtCore import Qt, QTimer, Signal, Slot, QPoint, QSize, QRectF, QPointF
 from PySide6.QtGui import QIcon, QPixmap, QPainter, QColor, QPen, QBrush, QPolygon, QPainterPath, QFont
@@ -209,8 +210,9 @@ class UIComponents:
         )
 
     @staticmethod
+    @lru_cache(maxsize=None)
     def create_help_icon():
-        """Create a help icon (question mark)"""
+        """Create a help icon (question mark), cached after the first build"""
         help_icon = QIcon.fromTheme("help-contents")
         if not help_icon.isNull():
             return help_icon
@@ -245,8 +247,9 @@ class UIComponents:
         return QIcon(pixmap)
 
     @staticmethod
+    @lru_cache(maxsize=None)
     def create_gear_icon():
-        """Create a gear icon for settings"""
+        """Create a gear icon for settings, cached after the first build"""
         pixmap = QPixmap(24, 24)
         pixmap.fill(Qt.transparent)
         painter = QPainter(pixmap)
@@ -360,7 +363,10 @@ class UIComponents:
         summary_text.setReadOnly(True)
         summary_text.setObjectName("outputArea")
 
-        raw_text = QTextEdit()
+        # The raw log only ever receives plain strings - QPlainTextEdit's
+        # per-line layout is far cheaper than QTextEdit's rich-text engine
+        # when a render spams thousands of lines
+        raw_text = QPlainTextEdit()
         raw_text.setReadOnly(True)
         raw_text.setObjectName("outputArea")
 
@@ -448,11 +454,12 @@ class UIComponents:
         # Add the last container (remaining) - no stretch after it
         stats_layout.addWidget(remaining_container)
 
-        # Style stats labels and values
+        # Tag stats labels and values so the application stylesheet covers
+        # them - one parsed rule instead of fourteen per-widget sheets
         for label in [fc_value, tfc_value, average_value, elapsed_value, total_value, eta_value, remaining_value]:
-            label.setStyleSheet(f"color: {CURRENT_COLOR}; font-weight: bold;")
+            label.setObjectName("statValue")
         for label in [fc_label, tfc_label, average_label, elapsed_label, total_label, eta_label, remaining_label]:
-            label.setStyleSheet("color: #d6d6d6; font-weight: normal;")
+            label.setObjectName("statLabel")
 
         return (
             stats_layout,
@@ -480,10 +487,19 @@ class UIComponents:
 
         return image_preview
 
+    # Set once the application stylesheet has been installed so extra
+    # window instances don't make Qt re-parse the multi-KB sheet
+    _stylesheet_applied = False
+
     @staticmethod
     def apply_stylesheet(widget):
-        """Apply the application stylesheet"""
-        widget.setStyleSheet(widget.styleSheet() + """
+        """Apply the application stylesheet at QApplication level (once)"""
+        if UIComponents._stylesheet_applied:
+            return
+        UIComponents._stylesheet_applied = True
+
+        app = QApplication.instance()
+        app.setStyleSheet(app.styleSheet() + """
             QWidget {
                 font-family: 'Inter', 'Segoe UI', 'Arial', sans-serif;
                 font-size: 14px;
@@ -795,4 +811,19 @@ class UIComponents:
                 background: #505050;
                 color: #ffffff;
             }
+            QLabel#statLabel {
+                color: #d6d6d6;
+                font-weight: normal;
+            }
+            QToolTip {
+                color: #fff;
+                background-color: #232323;
+                border: 1px solid #444;
+                padding: 6px 10px;
+            }
+        """ + f"""
+            QLabel#statValue {{
+                color: {CURRENT_COLOR};
+                font-weight: bold;
+            }}
         """)
@@ -1,12 +1,26 @@
+import numpy as np
 from PySide6.QtWidgets import QWidget, QToolTip, QApplication
 from PySide6.QtCore import Qt, QEvent, QRectF, QTimer, QPoint
-from PySide6.QtGui import QPainter, QColor
+from PySide6.QtGui import QPainter, QColor, QPainterPath, QBrush
 from ...utils.time_utils import format_time
 from ..widgets.custom_tooltip import CustomToolTip
 import sys
 
+# Frame status codes for the dense status array
+FRAME_PENDING = 0
+FRAME_COMPLETED = 1
+FRAME_SKIPPED = 2
+
 class FrameProgressWidget(QWidget):
     """Custom widget to display frame progress with variable-height bars"""
+
+    # Bar colors are shared by every instance, so build the QColor
+    # objects once at class scope
+    completed_color = QColor("#22adf2")    # Blue for completed frames
+    current_color = QColor("#ff4c00")      # Orange for current frame
+    placeholder_color = QColor("#444444")  # Dark gray for placeholder
+    skipped_color = QColor("#666666")      # Lighter gray for skipped frames
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setMinimumHeight(50)  # Set minimum height for the bar graph
@@ -19,8 +33,10 @@ class FrameProgressWidget(QWidget):
         # Set update behavior
         self.setAttribute(Qt.WidgetAttribute.WA_NoSystemBackground, False)
 
-        # Frame data
-        self.frame_times = {}  # Dictionary mapping frame numbers to render times
+        # Frame data - dense per-position arrays instead of dicts so the paint
+        # loop indexes by position without hashing
+        self.frame_times_arr = np.zeros(0, dtype=np.float32)  # Render time per widget position
+        self.frame_status_arr = np.zeros(0, dtype=np.uint8)   # FRAME_PENDING/COMPLETED/SKIPPED
         self.total_frames = 0
         self.current_frame = None  # Changed to None to indicate no current frame
         self.current_frame_progress = 0  # 0-100%
@@ -45,11 +61,12 @@ class FrameProgressWidget(QWidget):
         # Debug flag
         self.debug_paint = False
 
-        # Colors
-        self.completed_color = QColor("#22adf2")  # Blue for completed frames
-        self.current_color = QColor("#ff4c00")    # Orange for current frame
-        self.placeholder_color = QColor("#444444")  # Dark gray for placeholder
-        self.skipped_color = QColor("#666666")    # Lighter gray for skipped frames
+        # Prebuilt brushes so paintEvent doesn't construct QBrush objects
+        # on every repaint
+        self.completed_brush = QBrush(self.completed_color)
+        self.current_brush = QBrush(self.current_color)
+        self.placeholder_brush = QBrush(self.placeholder_color)
+        self.skipped_brush = QBrush(self.skipped_color)
 
         # Set background color and important styling for visibility
         self.setStyleSheet("""
@@ -89,7 +106,7 @@ class FrameProgressWidget(QWidget):
                 print(f"DEBUG: paintEvent triggered in FrameProgressWidget, visible={self.isVisible()}, total_frames={self.total_frames}")
                 if self.current_frame is not None:
                     print(f"DEBUG: Current frame in progress: {self.current_frame}, progress: {self.current_frame_progress}%")
-                print(f"DEBUG: Frame times: {self.frame_times}")
+                print(f"DEBUG: Frame times: {self.frame_times_arr}")
 
             painter = QPainter(self)
             painter.setRenderHint(QPainter.Antialiasing)
@@ -102,64 +119,79 @@ class FrameProgressWidget(QWidget):
                     print("DEBUG: No frames to draw")
                 return
 
+            # Hoist geometry reads out of the bar loops
+            widget_width = self.width()
+            widget_height = self.height()
+
             # Calculate bar width
-            bar_width = self.width() / self.total_frames
+            bar_width = widget_width / self.total_frames
             # Ensure there's a minimum width
             bar_width = max(3, bar_width)
             # Allow for tiny 1px spacing between bars if they're wide enough
             spacing = 1 if bar_width >= 5 else 0
 
             # Use full height for bars since we removed the text
-            available_height = self.height()
+            available_height = widget_height
+
+            # Batch bar geometry into one painter path per color class so each
+            # class is drawn with a single fill call instead of one Qt call per bar
+            placeholder_path = QPainterPath()
+            completed_path = QPainterPath()
+            skipped_path = QPainterPath()
+
+            # Alias the arrays locally - the loops below touch them per bar
+            status_arr = self.frame_status_arr
+            times_arr = self.frame_times_arr
+            placeholder_height = self.placeholder_height
 
-            # Draw placeholder bars first (lowest priority)
+            # Collect placeholder bars first (lowest priority)
             for widget_pos in range(self.total_frames):
                 x = widget_pos * bar_width
 
                 # Skip this frame position if it would be too small to see
-                if x + bar_width <= 0 or x >= self.width():
+                if x + bar_width <= 0 or x >= widget_width:
                     continue
 
                 # Skip positions that will be drawn in later phases
                 if (widget_pos == self.current_frame or
-                    widget_pos in self.frame_times or
+                    status_arr[widget_pos] != FRAME_PENDING or
                     widget_pos in self.recently_completed):
                     continue
 
-                # Draw placeholder bar with rounded corners
-                painter.setPen(Qt.NoPen)
-                painter.setBrush(self.placeholder_color)
-                painter.drawRoundedRect(
-                    QRectF(x, self.height() - self.placeholder_height, bar_width - spacing, self.placeholder_height),
+                placeholder_path.addRoundedRect(
+                    QRectF(x, widget_height - placeholder_height, bar_width - spacing, placeholder_height),
                     2, 2
                 )
 
-            # Draw completed and skipped frames (middle priority)
-            for widget_pos, time in self.frame_times.items():
+            # Collect completed and skipped frames (middle priority)
+            for widget_pos in np.flatnonzero(status_arr):
                 # Skip if it's the current frame (will be drawn later) or not a valid position
                 if widget_pos == self.current_frame or widget_pos >= self.total_frames:
                     continue
 
                 x = widget_pos * bar_width
+                time = float(times_arr[widget_pos])
 
-                if time > 0:
+                if status_arr[widget_pos] == FRAME_COMPLETED:
                     # Completed frame - blue bar with height based on render time
                     height = min((time / self.max_time) * available_height, available_height)
-                    painter.setPen(Qt.NoPen)
-                    painter.setBrush(self.completed_color)
-                    painter.drawRoundedRect(
-                        QRectF(x, self.height() - height, bar_width - spacing, height),
+                    completed_path.addRoundedRect(
+                        QRectF(x, widget_height - height, bar_width - spacing, height),
                         2, 2
                     )
                 else:
                     # Skipped frame - small placeholder bar with lighter color
-                    painter.setPen(Qt.NoPen)
-                    painter.setBrush(self.skipped_color)
-                    painter.drawRoundedRect(
-                        QRectF(x, self.height() - self.placeholder_height, bar_width - spacing, self.placeholder_height),
+                    skipped_path.addRoundedRect(
+                        QRectF(x, widget_height - placeholder_height, bar_width - spacing, placeholder_height),
                         2, 2
                     )
 
+            # Draw each class in priority order with a single call
+            painter.setPen(Qt.NoPen)
+            painter.fillPath(placeholder_path, self.placeholder_brush)
+            painter.fillPath(completed_path, self.completed_brush)
+            painter.fillPath(skipped_path, self.skipped_brush)
+
             # Draw current frame (highest priority)
             if self.current_frame is not None and self.current_frame < self.total_frames:
                 x = self.current_frame * bar_width
@@ -177,10 +209,9 @@ class FrameProgressWidget(QWidget):
                     progress_ratio = self.current_frame_progress / 100.0
                     height = self.placeholder_height + (progress_ratio * (available_height - self.placeholder_height))
 
-                painter.setPen(Qt.NoPen)
-                painter.setBrush(self.current_color)
+                painter.setBrush(self.current_brush)
                 painter.drawRoundedRect(
-                    QRectF(x, self.height() - height, bar_width - spacing, height),
+                    QRectF(x, widget_height - height, bar_width - spacing, height),
                     2, 2
                 )
 
@@ -265,10 +296,10 @@ class FrameProgressWidget(QWidget):
                 tooltip += f"<br>Estimated time: <b>{format_time(self.estimated_current_frame_time)}</b>"
             return tooltip
 
-        elif widget_pos in self.frame_times:
+        elif self.frame_status_arr[widget_pos] != FRAME_PENDING:
             # Completed or skipped frame
-            time = self.frame_times[widget_pos]
-            if time > 0:
+            time = float(self.frame_times_arr[widget_pos])
+            if self.frame_status_arr[widget_pos] == FRAME_COMPLETED:
                 # Completed frame
                 return f"<b>Frame {frame_number}</b><br>Render time: <b>{format_time(time)}</b>"
             else:
@@ -282,6 +313,17 @@ class FrameProgressWidget(QWidget):
         """Set the total number of frames and optionally the frame range"""
         print(f"DEBUG: Set total frames to {total}, ensuring progress_frame is visible")
         self.total_frames = total
+
+        # Resize the dense frame arrays, preserving any existing data
+        old_times = self.frame_times_arr
+        old_status = self.frame_status_arr
+        self.frame_times_arr = np.zeros(max(0, total), dtype=np.float32)
+        self.frame_status_arr = np.zeros(max(0, total), dtype=np.uint8)
+        keep = min(len(old_times), total)
+        if keep > 0:
+            self.frame_times_arr[:keep] = old_times[:keep]
+            self.frame_status_arr[:keep] = old_status[:keep]
+
         if frame_range:
             self.frame_range = frame_range
             # Create bidirectional mappings
@@ -315,11 +357,13 @@ class FrameProgressWidget(QWidget):
                 time_value = self.estimated_current_frame_time
             else:
                 # Default to average time if we have no estimate
-                times = [t for t in self.frame_times.values() if t > 0]
-                time_value = sum(times) / len(times) if times else 1.0
+                completed = self.frame_times_arr[self.frame_status_arr == FRAME_COMPLETED]
+                time_value = float(completed.mean()) if len(completed) else 1.0
 
             # Set the frame as completed by storing its time directly
-            self.frame_times[widget_pos] = time_value
+            if widget_pos is not None and 0 <= widget_pos < len(self.frame_times_arr):
+                self.frame_times_arr[widget_pos] = time_value
+                self.frame_status_arr[widget_pos] = FRAME_COMPLETED
             self.max_time = max(self.max_time, time_value)  # Update max time for scaling
 
             # Add to recently completed frames for smooth transition
@@ -348,7 +392,9 @@ class FrameProgressWidget(QWidget):
         print(f"DEBUG: Adding frame time for frame {frame} (widget position {widget_pos}): {time}")
 
         # Store frame time and update max time
-        self.frame_times[widget_pos] = time
+        if widget_pos is not None and 0 <= widget_pos < len(self.frame_times_arr):
+            self.frame_times_arr[widget_pos] = time
+            self.frame_status_arr[widget_pos] = FRAME_COMPLETED
         self.max_time = max(self.max_time, time)  # Update max time for scaling
 
         # Add to recently completed frames for smooth transition
@@ -375,7 +421,9 @@ class FrameProgressWidget(QWidget):
         widget_pos = self._get_widget_position(frame)
         print(f"DEBUG: Marking frame {frame} (widget position {widget_pos}) as skipped")
 
-        self.frame_times[widget_pos] = 0  # Skipped frames get 0 time
+        if widget_pos is not None and 0 <= widget_pos < len(self.frame_times_arr):
+            self.frame_times_arr[widget_pos] = 0  # Skipped frames get 0 time
+            self.frame_status_arr[widget_pos] = FRAME_SKIPPED
 
         # Clear current frame if this was the current frame
         if widget_pos == self.current_frame:
@@ -384,6 +432,10 @@ class FrameProgressWidget(QWidget):
 
         self.update()
 
+    def completed_times(self):
+        """Return the render times of all completed frames as a list of floats"""
+        return self.frame_times_arr[self.frame_status_arr == FRAME_COMPLETED].tolist()
+
     def _get_widget_position(self, frame):
         """Convert a frame number to a widget position"""
         # If we have a frame range, use the mapping
@@ -395,7 +447,8 @@ class FrameProgressWidget(QWidget):
     def clear(self):
         """Clear all frame data"""
         print("DEBUG: Clearing all frame data")
-        self.frame_times.clear()
+        self.frame_times_arr = np.zeros(max(0, self.total_frames), dtype=np.float32)
+        self.frame_status_arr = np.zeros(max(0, self.total_frames), dtype=np.uint8)
         self.current_frame = None  # Changed to None
         self.current_frame_progress = 0
         self.max_time = 1.0
@@ -1,13 +1,25 @@
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QFrame, QSizePolicy
 )
-from PySide6.QtCore import Qt, QSize, QPoint, QEvent
-from PySide6.QtGui import QPixmap, QPainter, QColor, QPen, QBrush, QPolygon, QPainterPath, QIcon, QFontMetrics
+from PySide6.QtCore import Qt, QSize, QPoint, QEvent, QTimer, QObject, QRunnable, QThreadPool, Signal
+from PySide6.QtGui import QPixmap, QImage, QPainter, QColor, QPen, QBrush, QPolygon, QPainterPath, QIcon, QFontMetrics
 from .custom_tooltip import CustomToolTip
 import os
 import time
 from ...utils.image_utils import load_exr_aovs
 
+# Style sheets applied per preview slot - shared constants so each slot
+# construction reuses one string instead of allocating its own copy
+_PREVIEW_LABEL_STYLE = "color: #ffffff; padding: 2px 2px 3px 2px; min-height: 14px; max-height: 14px; font-size: 10px;"
+_IMAGE_LABEL_STYLE = "background-color: #212121;"
+
+# Shared grey used by the placeholder painter - parsed from the color
+# string once at import instead of per drawing call
+_GREY_555 = QColor("#555555")
+_GREY_555_BRUSH = QBrush(_GREY_555)
+_GREY_555_PEN = QPen(_GREY_555)
+_GREY_555_PEN.setWidth(2)
+
 
 class ImageHandler:
     """Class for handling image loading and processing operations"""
@@ -60,31 +72,32 @@ class ImageHandler:
         # Timeout reached, consider the file still in use
         return True
 
-    def load_image(self, image_path, preview_widget):
+    @staticmethod
+    def _error_placeholder(label):
+        """Dark-grey stand-in image used when decoding fails"""
+        image = QImage(200, 200, QImage.Format.Format_RGB32)
+        image.fill(Qt.GlobalColor.darkGray)
+        return [(image, label)]
+
+    def decode_image(self, image_path):
         """
-        Load an image file and update the image preview widget.
+        Decode an image file into preview images.
+
+        Runs on a worker thread: the file-stability wait and the OIIO/NumPy
+        decode both block, so only QImages are produced here - converting
+        to pixmaps is left to the GUI thread. The output callbacks are safe
+        to call from here because they only enqueue text.
 
         Args:
             image_path: Path to the image file
-            preview_widget: ImagePreviewWidget instance to update
 
         Returns:
-            bool: True if image was loaded successfully, False otherwise
+            List of (QImage, label) tuples; empty if nothing could be shown
         """
         if not image_path or not os.path.exists(image_path):
-            preview_widget.update_preview([])
-            return False
+            return []
 
         try:
-            # Check if file exists
-            if not os.path.exists(image_path):
-                if self.output_callback:
-                    self.output_callback(
-                        f"Cannot find image: {os.path.basename(image_path)}",
-                        color='#ff6666'
-                    )
-                return False
-
             # Check if the file is complete (not still being written)
             if self.is_file_in_use(image_path, timeout=3.0):
                 # If the file is still being written, show a message and wait
@@ -93,15 +106,14 @@ class ImageHandler:
                         f"Waiting for image to finish writing: {os.path.basename(image_path)}",
                         color='#aaaaaa'
                     )
-                preview_widget.update_preview([])
-                return False
+                return []
 
             # Handle based on file extension
             if image_path.lower().endswith('.exr'):
-                return self.load_exr(image_path, preview_widget)
+                return self.decode_exr(image_path)
             else:
                 # For other image types, load directly
-                return self.load_generic_image(image_path, preview_widget)
+                return self.decode_generic_image(image_path)
 
         except Exception as e:
             # Handle error gracefully
@@ -111,22 +123,17 @@ class ImageHandler:
             if self.raw_output_callback:
                 self.raw_output_callback(f"Error loading image {image_path}: {str(e)}")
 
-            # Show placeholder with error
-            pixmap = QPixmap(200, 200)
-            pixmap.fill(Qt.GlobalColor.darkGray)
-            preview_widget.update_preview([(pixmap, "Image Preview Error")])
-            return False
+            return self._error_placeholder("Image Preview Error")
 
-    def load_exr(self, image_path, preview_widget):
+    def decode_exr(self, image_path):
         """
-        Load an EXR file and update the image preview area with its AOVs.
+        Decode an EXR file into one QImage per AOV.
 
         Args:
             image_path: Path to the EXR file
-            preview_widget: ImagePreviewWidget instance to update
 
         Returns:
-            bool: True if image was loaded successfully, False otherwise
+            List of (QImage, label) tuples
         """
         try:
             # Get file size for debug purposes
@@ -148,12 +155,9 @@ class ImageHandler:
                     )
 
                 # Create a placeholder instead
-                pixmap = QPixmap(200, 200)
-                pixmap.fill(Qt.GlobalColor.darkGray)
-                images = [(pixmap, "EXR Preview Unavailable")]
+                images = self._error_placeholder("EXR Preview Unavailable")
 
-            preview_widget.update_preview(images)
-            return True
+            return images
         except Exception as e:
             # Handle error gracefully
             error_msg = f"Error loading EXR file: {str(e)}"
@@ -162,29 +166,23 @@ class ImageHandler:
             if self.raw_output_callback:
                 self.raw_output_callback(f"Error loading EXR {image_path}: {str(e)}")
 
-            # Show placeholder with error
-            pixmap = QPixmap(200, 200)
-            pixmap.fill(Qt.GlobalColor.darkGray)
-            preview_widget.update_preview([(pixmap, "EXR Preview Error")])
-            return False
+            return self._error_placeholder("EXR Preview Error")
 
-    def load_generic_image(self, image_path, preview_widget):
+    def decode_generic_image(self, image_path):
         """
-        Load a non-EXR image file and update the preview widget.
+        Decode a non-EXR image file.
 
         Args:
             image_path: Path to the image file
-            preview_widget: ImagePreviewWidget instance to update
 
         Returns:
-            bool: True if image was loaded successfully, False otherwise
+            List with a single (QImage, label) tuple, or empty on failure
         """
         try:
-            pixmap = QPixmap(image_path)
-            if not pixmap.isNull():
+            image = QImage(image_path)
+            if not image.isNull():
                 # Create a single image preview
-                preview_widget.update_preview([(pixmap, os.path.basename(image_path))])
-                return True
+                return [(image, os.path.basename(image_path))]
             else:
                 # If we can't load the image, show error
                 if self.output_callback:
@@ -192,16 +190,38 @@ class ImageHandler:
                         f"Cannot load image preview for: {os.path.basename(image_path)}",
                         color='#ff6666'
                     )
-                preview_widget.update_preview([])
-                return False
+                return []
         except Exception as e:
             if self.output_callback:
                 self.output_callback(
                     f"Error loading image: {str(e)}",
                     color='#ff6666'
                 )
-            preview_widget.update_preview([])
-            return False
+            return []
+
+
+class ImageLoadWorker(QRunnable):
+    """
+    Runnable that decodes a preview image off the GUI thread.
+    Submitted to the global QThreadPool like the hip-files loader; the
+    decoded QImages come back via a queued signal together with the
+    generation they belong to, so stale results from a superseded frame
+    can be dropped.
+    """
+
+    class Signals(QObject):
+        finished = Signal(int, list)  # generation, list of (QImage, label)
+
+    def __init__(self, image_path, generation, handler):
+        super().__init__()
+        self.image_path = image_path
+        self.generation = generation
+        self.handler = handler
+        self.signals = ImageLoadWorker.Signals()
+
+    def run(self):
+        images = self.handler.decode_image(self.image_path)
+        self.signals.finished.emit(self.generation, images)
 
 
 class PreviewLabel(QLabel):
@@ -210,7 +230,7 @@ class PreviewLabel(QLabel):
         self._tooltip_callback = tooltip_callback
         self._full_text = ""
         # Set specific style to ensure visibility
-        self.setStyleSheet("color: #ffffff; padding: 2px 2px 3px 2px; min-height: 14px; max-height: 14px; font-size: 10px;")
+        self.setStyleSheet(_PREVIEW_LABEL_STYLE)
         self.setAlignment(Qt.AlignmentFlag.AlignCenter)
 
     def setFullText(self, text):
@@ -262,35 +282,25 @@ class ImagePreviewWidget(QFrame):
 
         self.image_layout.addWidget(placeholder_container)
 
-        # Pre-create image+label containers (max 20 AOVs)
+        # Image+label containers are created lazily - most renders show a
+        # handful of AOVs, and every idle container still costs layout
+        # traversal on each resize
         self.image_widgets = []
         self._custom_tooltip = CustomToolTip()
-        for _ in range(20):
-            container = QWidget()
-            container.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
-            container_layout = QVBoxLayout(container)
-            container_layout.setSpacing(4)
-            container_layout.setContentsMargins(0, 0, 0, 0)
 
-            image_label = QLabel()
-            image_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            image_label.setStyleSheet("background-color: #212121;")
-            image_label.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
+        # Store original pixmaps for resizing (grows with the slots)
+        self.original_pixmaps = []
 
-            name_label = PreviewLabel(tooltip_callback=self._handle_tooltip)
-            # Style is now set in PreviewLabel constructor
-            name_label.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
-            name_label.setTextInteractionFlags(Qt.TextInteractionFlag.NoTextInteraction)
-            name_label.setWordWrap(False)
+        # Geometry of the last adjust_sizes pass - rescaling with smooth
+        # transformation is expensive, so skip it when nothing changed
+        self._last_layout = None
 
-            container_layout.addWidget(image_label)
-            container_layout.addWidget(name_label)
-            self.image_layout.addWidget(container)
-            container.hide()
-            self.image_widgets.append((image_label, name_label))
-
-        # Store original pixmaps for resizing
-        self.original_pixmaps = [None] * 20
+        # While a window drag is in flight, scale thumbnails with the cheap
+        # fast transformation and do one smooth pass after the drag settles
+        self._smooth_rescale_timer = QTimer(self)
+        self._smooth_rescale_timer.setSingleShot(True)
+        self._smooth_rescale_timer.setInterval(150)
+        self._smooth_rescale_timer.timeout.connect(self._rescale_smooth)
 
         # Create placeholder icon
         self._create_placeholder_icon()
@@ -298,18 +308,26 @@ class ImagePreviewWidget(QFrame):
         # Create image handler
         self.image_handler = ImageHandler()
 
-    def _create_placeholder_icon(self):
-        """Create the placeholder icon for when no images are available"""
-        icon_size = 80
+        # Monotonic counter so late worker results for superseded frames
+        # can be recognized and discarded
+        self._preview_generation = 0
+
+    # Memoized placeholder pixmap - the drawing never varies, so one
+    # shared copy serves every widget instance
+    _placeholder_icon = None
+
+    @classmethod
+    def _get_placeholder_icon(cls, icon_size=80):
+        """Return the shared placeholder mountain icon, drawing it on first use"""
+        if cls._placeholder_icon is not None:
+            return cls._placeholder_icon
+
         icon = QPixmap(icon_size, icon_size)
         icon.fill(Qt.transparent)
         painter = QPainter(icon)
         painter.setRenderHint(QPainter.Antialiasing)
-        pen = QPen(QColor("#555555"))
-        pen.setWidth(2)
-        painter.setPen(pen)
-        brush = QBrush(QColor("#555555"))
-        painter.setBrush(brush)
+        painter.setPen(_GREY_555_PEN)
+        painter.setBrush(_GREY_555_BRUSH)
 
         # Draw mountains (filled triangles)
         # Back mountain
@@ -329,16 +347,54 @@ class ImagePreviewWidget(QFrame):
         painter.drawPolygon(QPolygon(points_front))
 
         # Draw sun (positioned above mountains)
-        painter.setBrush(QBrush(QColor("#555555")))
         sun_size = icon_size//6
         painter.drawEllipse(icon_size-sun_size-10, 8, sun_size, sun_size)
         painter.end()
 
+        cls._placeholder_icon = icon
+        return icon
+
+    def _create_placeholder_icon(self):
+        """Create the placeholder icon for when no images are available"""
+        icon = self._get_placeholder_icon()
+        icon_size = icon.width()
+
         # Set the icon to the placeholder
         self.placeholder_widget.setPixmap(icon)
         self.placeholder_widget.setMinimumSize(icon_size, icon_size)
         self.placeholder_widget.setAlignment(Qt.AlignmentFlag.AlignCenter)
 
+    # Upper bound on preview slots, matching load_exr_aovs' max_aovs
+    _MAX_SLOTS = 20
+
+    def _ensure_image_slot(self, index):
+        """Return the (image_label, name_label) pair for a slot, building it on first use"""
+        while len(self.image_widgets) <= index:
+            container = QWidget()
+            container.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
+            container_layout = QVBoxLayout(container)
+            container_layout.setSpacing(4)
+            container_layout.setContentsMargins(0, 0, 0, 0)
+
+            image_label = QLabel()
+            image_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+            image_label.setStyleSheet(_IMAGE_LABEL_STYLE)
+            image_label.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
+
+            name_label = PreviewLabel(tooltip_callback=self._handle_tooltip)
+            # Style is now set in PreviewLabel constructor
+            name_label.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
+            name_label.setTextInteractionFlags(Qt.TextInteractionFlag.NoTextInteraction)
+            name_label.setWordWrap(False)
+
+            container_layout.addWidget(image_label)
+            container_layout.addWidget(name_label)
+            self.image_layout.addWidget(container)
+            container.hide()
+            self.image_widgets.append((image_label, name_label))
+            self.original_pixmaps.append(None)
+        return self.image_widgets[index]
+
     def _handle_tooltip(self, text, global_pos):
         if text and global_pos:
             # Use 700ms delay (standard tooltip delay)
@@ -367,13 +423,14 @@ class ImagePreviewWidget(QFrame):
             # Show placeholder with minimum height
             placeholder_container.show()
             self.setFixedHeight(120)
+            self._last_layout = None
             return
 
         # Show and update only as many containers as needed
         for i, (pixmap, label_text) in enumerate(images):
-            if i >= len(self.image_widgets):
+            if i >= self._MAX_SLOTS:
                 break
-            image_label, name_label = self.image_widgets[i]
+            image_label, name_label = self._ensure_image_slot(i)
             self.original_pixmaps[i] = pixmap
             image_label.setPixmap(pixmap)
             metrics = QFontMetrics(name_label.font())
@@ -383,19 +440,24 @@ class ImagePreviewWidget(QFrame):
             image_label.parent().show()
             self.image_layout.setStretchFactor(image_label.parent(), 1)
 
-        # Adjust sizes after adding images
+        # New pixmaps invalidate the cached layout; adjust sizes after adding images
+        self._last_layout = None
         self.adjust_sizes()
 
     def load_image(self, image_path, output_callback=None, raw_output_callback=None):
         """Load an image file and update the preview widget.
 
+        The decode (file-stability wait, OIIO, NumPy) runs on the thread
+        pool so the GUI never stalls; the preview is updated once the
+        worker delivers its images.
+
         Args:
             image_path: Path to the image file
             output_callback: Optional callback for user messages
             raw_output_callback: Optional callback for raw log messages
 
         Returns:
-            bool: True if image was loaded successfully, False otherwise
+            bool: True if the load was scheduled
         """
         # Update the image handler's callbacks if provided
         if output_callback:
@@ -403,12 +465,31 @@ class ImagePreviewWidget(QFrame):
         if raw_output_callback:
             self.image_handler.raw_output_callback = raw_output_callback
 
-        # Use the image handler to load the image
-        return self.image_handler.load_image(image_path, self)
+        # Each request supersedes any still in flight
+        self._preview_generation += 1
+        worker = ImageLoadWorker(image_path, self._preview_generation, self.image_handler)
+        worker.signals.finished.connect(self._on_images_decoded)
+        QThreadPool.globalInstance().start(worker)
+        return True
+
+    def _on_images_decoded(self, generation, images):
+        """Install decoded preview images delivered by a worker"""
+        # A newer frame has been requested since this worker started -
+        # drop its result instead of flashing a stale preview
+        if generation != self._preview_generation:
+            return
+
+        self.update_preview([
+            (QPixmap.fromImage(image), label) for image, label in images
+        ])
 
     def adjust_sizes(self):
         """Dynamically adjust the size of image preview thumbnails and frame height."""
-        visible = [w for w in self.image_widgets if w[0].parent().isVisible()]
+        # Resolve each label's container once - parent() and isVisible()
+        # both cross into Qt, so query them a single time per pass
+        visible = [(label, name_label, label.parent())
+                   for label, name_label in self.image_widgets
+                   if label.parent().isVisible()]
         count = len(visible)
 
         if count == 0:
@@ -419,9 +500,16 @@ class ImagePreviewWidget(QFrame):
         available_width = self.width() - (self.image_layout.spacing() * (count - 1)) - 8  # Minimal padding
         target_width = available_width // count
 
+        # Same container count and target width as last time means the
+        # scaled pixmaps are already correct - nothing to redo
+        layout_key = (count, target_width)
+        if layout_key == self._last_layout:
+            return
+        self._last_layout = layout_key
+
         # Process each visible image container
         max_height = 0
-        for i, (image_label, name_label) in enumerate(visible):
+        for i, (image_label, name_label, container) in enumerate(visible):
             original_pixmap = self.original_pixmaps[i]
             if original_pixmap and not original_pixmap.isNull():
                 # Calculate scaled size maintaining aspect ratio
@@ -429,12 +517,17 @@ class ImagePreviewWidget(QFrame):
                 aspect_ratio = original_size.height() / original_size.width()
                 scaled_height = int(target_width * aspect_ratio)
 
-                # Scale the pixmap
+                # Scale the pixmap - cheap filtering while a resize burst is
+                # still active, smooth once it has settled
+                if self._smooth_rescale_timer.isActive():
+                    mode = Qt.TransformationMode.FastTransformation
+                else:
+                    mode = Qt.TransformationMode.SmoothTransformation
                 scaled = original_pixmap.scaled(
                     target_width,
                     scaled_height,
                     Qt.AspectRatioMode.KeepAspectRatio,
-                    Qt.TransformationMode.SmoothTransformation
+                    mode
                 )
 
                 image_label.setPixmap(scaled)
@@ -451,8 +544,7 @@ class ImagePreviewWidget(QFrame):
         label_area_height = 24
 
         # Set fixed heights for containers
-        for image_label, name_label in visible:
-            container = image_label.parent()
+        for image_label, name_label, container in visible:
             container.setFixedHeight(max_height + label_area_height)
 
         # Total frame height includes:
@@ -464,7 +556,13 @@ class ImagePreviewWidget(QFrame):
         total_height = max_height + label_area_height + 10 + 20
         self.setFixedHeight(total_height)
 
+    def _rescale_smooth(self):
+        """Redo the last scaling pass with smooth filtering after a resize settles"""
+        self._last_layout = None
+        self.adjust_sizes()
+
     def resizeEvent(self, event):
         """Handle resize events to maintain proper image scaling"""
         super().resizeEvent(event)
+        self._smooth_rescale_timer.start()
         self.adjust_sizes()
@@ -5,6 +5,10 @@ class LoadingComboBox(QComboBox):
     """Custom ComboBox with loading state animation"""
     loading_state_changed = Signal(bool)
 
+    # Animation frames are fixed, so build them once instead of
+    # allocating a new "Loading" + dots string every timer tick
+    _LOADING_FRAMES = ("Loading", "Loading.", "Loading..", "Loading...")
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self._loading = False  # Use private variable
@@ -35,5 +39,4 @@ class LoadingComboBox(QComboBox):
     def update_loading_text(self):
         """Update the loading animation dots"""
         self.loading_dots = (self.loading_dots + 1) % 4
-        dots = "." * self.loading_dots
-        self.setEditText(f"Loading{dots}")
+        self.setEditText(self._LOADING_FRAMES[self.loading_dots])
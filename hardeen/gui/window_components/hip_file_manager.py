@@ -2,11 +2,57 @@ import os
 import threading
 from typing import List, Tuple, Callable, Optional, Any, Dict
 from PySide6.QtWidgets import QComboBox, QMessageBox, QFileDialog, QApplication
-from PySide6.QtCore import QObject, QTimer, Signal
+from PySide6.QtCore import QObject, QTimer, Signal, QRunnable, QThreadPool
 
 from ...core.houdini import HoudiniManager
 from ...config import DEFAULT_FOLDER
 
+class HipFilesLoader(QRunnable):
+    """
+    Runnable that reads the Houdini file.history off the GUI thread.
+    Submitted to the global QThreadPool so no dedicated thread is spawned
+    per refresh; results are delivered back via a queued signal.
+    """
+
+    class Signals(QObject):
+        finished = Signal(list)  # list of hip file paths
+
+    def __init__(self):
+        super().__init__()
+        self.signals = HipFilesLoader.Signals()
+
+    def run(self):
+        history_file = HoudiniManager.get_houdini_history_file()
+        hip_files = HoudiniManager.parse_hip_files(history_file) if history_file else []
+        self.signals.finished.emit(hip_files)
+
+class OutNodesLoader(QRunnable):
+    """
+    Runnable that parses a hip file's out nodes off the GUI thread.
+    The fallback parse launches a full hython subprocess that can take
+    many seconds to start, so it must not run on the GUI thread; the
+    combo's loading animation plays while the pool does the work.
+    """
+
+    class Signals(QObject):
+        finished = Signal(int, list, dict)  # generation, nodes, node settings
+        failed = Signal(int, str)  # generation, error message
+
+    def __init__(self, houdini_manager: HoudiniManager, hip_file: str, generation: int):
+        super().__init__()
+        self.houdini_manager = houdini_manager
+        self.hip_file = hip_file
+        self.generation = generation
+        self.signals = OutNodesLoader.Signals()
+
+    def run(self):
+        try:
+            out_nodes, node_settings = self.houdini_manager.parse_out_nodes(self.hip_file)
+        except Exception as e:
+            self.signals.failed.emit(self.generation, str(e))
+            return
+        self.signals.finished.emit(self.generation, out_nodes, node_settings)
+
 class HipFileManager(QObject):
     """
     Manages Houdini HIP file operations for the application.
@@ -42,6 +88,18 @@ class HipFileManager(QObject):
         # Flag to track when settings are being loaded
         self._loading_settings = False
 
+        # Coalesce currentTextChanged bursts - typing a path in the
+        # editable combo emits one signal per keystroke, and each
+        # uncoalesced change would spawn a hython out-node refresh
+        self._pending_hip_file = None
+        # Bumped per refresh so a stale parse result (the user switched
+        # hip files while hython was still starting) is dropped
+        self._out_nodes_generation = 0
+        self._hip_changed_timer = QTimer(self)
+        self._hip_changed_timer.setSingleShot(True)
+        self._hip_changed_timer.setInterval(300)
+        self._hip_changed_timer.timeout.connect(self._process_hip_file_changed)
+
     def set_widgets(self, hip_input: QComboBox, out_input: QComboBox):
         """Set or update widget references"""
         self.hip_input = hip_input
@@ -52,6 +110,16 @@ class HipFileManager(QObject):
         if not self.hip_input:
             return
 
+        # Read the history file on the thread pool so the GUI stays responsive
+        loader = HipFilesLoader()
+        loader.signals.finished.connect(self._on_hip_files_loaded)
+        QThreadPool.globalInstance().start(loader)
+
+    def _on_hip_files_loaded(self, hip_files: List[str]):
+        """Populate the hip combo box once the history has been read"""
+        if not self.hip_input:
+            return
+
         # Remember current selection
         current_selection = self.hip_input.currentText()
 
@@ -60,10 +128,7 @@ class HipFileManager(QObject):
 
         # Clear and load new files
         self.hip_input.clear()
-        history_file = self.houdini_manager.get_houdini_history_file()
-        if history_file:
-            hip_files = self.houdini_manager.parse_hip_files(history_file)
-            self.hip_input.addItems(hip_files)
+        self.hip_input.addItems(hip_files)
 
         # Restore previous selection if it exists in the new list
         if current_selection:
@@ -101,7 +166,7 @@ class HipFileManager(QObject):
             self.hip_input.setCurrentText(file_path)
 
     def on_hip_file_changed(self, hip_file: str):
-        """Handle hip file selection change"""
+        """Handle hip file selection change (debounced)"""
         if not hip_file:
             return
 
@@ -109,6 +174,17 @@ class HipFileManager(QObject):
         if self._loading_settings:
             return
 
+        # Restart the timer on every change so only the final value in a
+        # burst is processed
+        self._pending_hip_file = hip_file
+        self._hip_changed_timer.start()
+
+    def _process_hip_file_changed(self):
+        """Process the last hip file change once the burst has settled"""
+        hip_file = self._pending_hip_file
+        if not hip_file or self._loading_settings:
+            return
+
         # Emit signal for logging
         self.output_update.emit(
             f"\nSelected HIP file:\n",
@@ -155,8 +231,16 @@ class HipFileManager(QObject):
             if hasattr(self.out_input, 'start_loading'):
                 self.out_input.start_loading()
 
-            # Use QTimer to allow the UI to update before processing
-            QTimer.singleShot(100, lambda: self._process_out_nodes(hip_file, current_text))
+            # Parse on the thread pool so the (potentially multi-second)
+            # hython startup never blocks the GUI
+            self._out_nodes_generation += 1
+            loader = OutNodesLoader(self.houdini_manager, hip_file, self._out_nodes_generation)
+            loader.signals.finished.connect(
+                lambda generation, nodes, settings:
+                    self._on_out_nodes_parsed(generation, current_text, nodes, settings)
+            )
+            loader.signals.failed.connect(self._on_out_nodes_failed)
+            QThreadPool.globalInstance().start(loader)
         else:
             # Show warning if hip file doesn't exist
             parent = self.parent() if self.parent() else None
@@ -165,85 +249,90 @@ class HipFileManager(QObject):
             # Emit empty out nodes signal so the UI can update appropriately
             self.out_nodes_loaded.emit([], {})
 
-    def _process_out_nodes(self, hip_file: str, current_text: str):
-        """Process out nodes after showing loading state"""
+    def _on_out_nodes_parsed(self, generation: int, current_text: str,
+                             out_nodes: List[str], node_settings: dict):
+        """Populate the out-node combo with a worker's parse results"""
         if not self.out_input:
             return
 
-        try:
-            # Get out nodes from hip file through houdini manager
-            out_nodes, node_settings = self.houdini_manager.parse_out_nodes(hip_file)
-
-            # Stop loading animation if available
-            if hasattr(self.out_input, 'stop_loading'):
-                self.out_input.stop_loading()
-
-            if out_nodes:
-                # Reverse the list so latest nodes appear first
-                out_nodes.reverse()
-
-                # Add nodes to combo box
-                self.out_input.addItems(out_nodes)
-
-                # Emit signal for logging - only if not during loading settings
-                if not self._loading_settings:
-                    self.output_update.emit(
-                        f"\nFound {len(out_nodes)} out nodes:\n",
-                        '#7abfff',
-                        True,
-                        False
-                    )
-
-                    for node in out_nodes:
-                        self.output_update.emit(f"  {node}\n", '#d6d6d6', False, False)
-
-            # Add saved paths from settings if available and we have a settings manager
-            if self.settings_manager:
-                saved_paths = self.settings_manager.get_list('outnames', [])
-                if saved_paths:
-                    for path in saved_paths:
-                        if path not in out_nodes:
-                            self.out_input.addItem(path)
-
-            # Select the most recent out node (first in the list) or restore previous selection
-            if out_nodes:
-                first_node = out_nodes[0]
-                self.out_input.setCurrentText(first_node)
-            elif current_text:
-                # If no new nodes found but we had a previous selection, restore it
-                self.out_input.setEditText(current_text)
-
-            # If no nodes were found, log that information - only if not during loading settings
-            if not out_nodes and not self._loading_settings:
-                self.output_update.emit(
-                    "\nNo out nodes found in the selected HIP file",
-                    '#ff6666',
-                    True,
-                    False
-                )
+        # A newer refresh has been requested since this worker started
+        if generation != self._out_nodes_generation:
+            return
 
-            # Store node settings for later use
-            self.node_settings = node_settings
+        # Stop loading animation if available
+        if hasattr(self.out_input, 'stop_loading'):
+            self.out_input.stop_loading()
 
-            # Emit signal that out nodes have been loaded
-            self.out_nodes_loaded.emit(out_nodes, node_settings)
+        if out_nodes:
+            # Reverse the list so latest nodes appear first
+            out_nodes.reverse()
 
-        except Exception as e:
-            # Handle any exceptions during parsing
-            if hasattr(self.out_input, 'stop_loading'):
-                self.out_input.stop_loading()
+            # Add nodes to combo box
+            self.out_input.addItems(out_nodes)
 
-            # Only emit error if not during loading settings
+            # Emit signal for logging - only if not during loading settings
             if not self._loading_settings:
                 self.output_update.emit(
-                    f"\nError parsing out nodes: {str(e)}\n",
-                    '#ff0000',
+                    f"\nFound {len(out_nodes)} out nodes:\n",
+                    '#7abfff',
                     True,
                     False
                 )
 
-            # Emit empty results on error
-            self.out_nodes_loaded.emit([], {})
+                for node in out_nodes:
+                    self.output_update.emit(f"  {node}\n", '#d6d6d6', False, False)
+
+        # Add saved paths from settings if available and we have a settings manager
+        if self.settings_manager:
+            saved_paths = self.settings_manager.get_list('outnames', [])
+            if saved_paths:
+                # One addItems call instead of one model update per path
+                extras = [path for path in saved_paths if path not in out_nodes]
+                if extras:
+                    self.out_input.addItems(extras)
+
+        # Select the most recent out node (first in the list) or restore previous selection
+        if out_nodes:
+            first_node = out_nodes[0]
+            self.out_input.setCurrentText(first_node)
+        elif current_text:
+            # If no new nodes found but we had a previous selection, restore it
+            self.out_input.setEditText(current_text)
+
+        # If no nodes were found, log that information - only if not during loading settings
+        if not out_nodes and not self._loading_settings:
+            self.output_update.emit(
+                "\nNo out nodes found in the selected HIP file",
+                '#ff6666',
+                True,
+                False
+            )
+
+        # Store node settings for later use
+        self.node_settings = node_settings
+
+        # Emit signal that out nodes have been loaded
+        self.out_nodes_loaded.emit(out_nodes, node_settings)
+
+    def _on_out_nodes_failed(self, generation: int, error: str):
+        """Handle a parse failure reported by a worker"""
+        if generation != self._out_nodes_generation:
+            return
+
+        if self.out_input and hasattr(self.out_input, 'stop_loading'):
+            self.out_input.stop_loading()
+
+        # Only emit error if not during loading settings
+        if not self._loading_settings:
+            self.output_update.emit(
+                f"\nError parsing out nodes: {error}\n",
+                '#ff0000',
+                True,
+                False
+            )
+
+        # Emit empty results on error
+        self.out_nodes_loaded.emit([], {})
 
     def get_node_settings(self) -> Dict:
         """Get the current node settings dictionary"""
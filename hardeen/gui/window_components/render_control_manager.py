@@ -295,8 +295,7 @@ class RenderControlManager(QObject):
         self.ui['cancel_btn'].setText('Interrupt')
 
         # Get average from progress frame if available
-        frame_times = getattr(self.ui['progress_frame'], 'frame_times', {})
-        times = [t for t in frame_times.values() if t > 0]
+        times = self.ui['progress_frame'].completed_times()
         average = sum(times) / len(times) if times else 0.0
 
         # Keep the time labels with correct values (don't reset)
@@ -4,7 +4,7 @@ import subprocess
 from typing import Callable, Optional
 from PySide6.QtCore import QObject, QTimer, Signal
 from PySide6.QtWidgets import QMessageBox, QApplication
-from ...config import SHUTDOWN_DELAYS
+from ...config import SHUTDOWN_DELAYS, SHUTDOWN_DELAY_SECONDS
 
 
 class ShutdownManager(QObject):
@@ -80,40 +80,31 @@ class ShutdownManager(QObject):
         # Get stored delay value using standardized format
         delay_text = self.settings_manager.get('shutdown_delay', SHUTDOWN_DELAYS[0])
 
-        # Map the delay text to seconds
-        if delay_text == SHUTDOWN_DELAYS[0]:  # "No delay"
-            return 5  # Minimal delay for safety
-        elif delay_text == SHUTDOWN_DELAYS[1]:  # "1 minute"
-            return 60
-        elif delay_text == SHUTDOWN_DELAYS[2]:  # "5 minutes"
-            return 5 * 60
-        elif delay_text == SHUTDOWN_DELAYS[3]:  # "10 minutes"
-            return 10 * 60
-        elif delay_text == SHUTDOWN_DELAYS[4]:  # "30 minutes"
-            return 30 * 60
-        elif delay_text == SHUTDOWN_DELAYS[5]:  # "1 hour"
-            return 60 * 60
-        else:
-            # For backward compatibility, fallback to parsing
-            # Try to extract number of minutes/hours from the string
-            try:
-                if "minute" in delay_text:
-                    minutes = int(delay_text.split()[0])
-                    return minutes * 60
-                elif "hour" in delay_text:
-                    hours = int(delay_text.split()[0])
-                    return hours * 3600
-                elif "m delay" in delay_text:
-                    minutes = int(delay_text.split("m")[0])
-                    return minutes * 60
-                elif "h delay" in delay_text:
-                    hours = int(delay_text.split("h")[0])
-                    return hours * 3600
-            except (ValueError, IndexError):
-                pass
-
-            # If all else fails, default to minimal delay
-            return 5
+        # Map the delay text to seconds via the precomputed table
+        seconds = SHUTDOWN_DELAY_SECONDS.get(delay_text)
+        if seconds is not None:
+            return seconds
+
+        # For backward compatibility, fallback to parsing
+        # Try to extract number of minutes/hours from the string
+        try:
+            if "minute" in delay_text:
+                minutes = int(delay_text.split()[0])
+                return minutes * 60
+            elif "hour" in delay_text:
+                hours = int(delay_text.split()[0])
+                return hours * 3600
+            elif "m delay" in delay_text:
+                minutes = int(delay_text.split("m")[0])
+                return minutes * 60
+            elif "h delay" in delay_text:
+                hours = int(delay_text.split("h")[0])
+                return hours * 3600
+        except (ValueError, IndexError):
+            pass
+
+        # If all else fails, default to minimal delay
+        return 5
 
     def run_shutdown_countdown(self, delay_seconds, test_mode=False):
         """Run the shutdown countdown with a message box"""
@@ -122,17 +113,21 @@ class ShutdownManager(QObject):
         countdown_dialog.setStandardButtons(QMessageBox.Cancel)
         countdown_dialog.button(QMessageBox.Cancel).setText("Cancel Shutdown")
 
-        # Create a timer for the countdown
-        timer = QTimer(self.parent)
+        # Create a timer for the countdown, owned by the dialog so it can
+        # never outlive it
+        timer = QTimer(countdown_dialog)
         remaining_time = delay_seconds
 
+        # The leading text never changes - build it once instead of
+        # re-evaluating the conditional f-string on every tick
+        text_prefix = f"Computer will {'simulate' if test_mode else ''} shutdown in "
+
         def update_countdown():
             nonlocal remaining_time
             if remaining_time > 0:
                 minutes = remaining_time // 60
                 seconds = remaining_time % 60
-                countdown_dialog.setText(f"Computer will {'simulate' if test_mode else ''} shutdown in "
-                                         f"{minutes:02d}:{seconds:02d}")
+                countdown_dialog.setText(f"{text_prefix}{minutes:02d}:{seconds:02d}")
                 remaining_time -= 1
             else:
                 timer.stop()
@@ -147,20 +142,20 @@ class ShutdownManager(QObject):
                 else:
                     self.execute_shutdown()
 
-        # Start the countdown
+        # Start the countdown; stop it on any close path (cancel button,
+        # Esc, window close) rather than only on explicit cancel
         timer.timeout.connect(update_countdown)
+        countdown_dialog.finished.connect(timer.stop)
         timer.start(1000)  # Update every second
 
         # Initialize dialog text
         minutes = delay_seconds // 60
         seconds = delay_seconds % 60
-        countdown_dialog.setText(f"Computer will {'simulate' if test_mode else ''} shutdown in "
-                                 f"{minutes:02d}:{seconds:02d}")
+        countdown_dialog.setText(f"{text_prefix}{minutes:02d}:{seconds:02d}")
 
         # Show the dialog
         if countdown_dialog.exec() == QMessageBox.Cancel:
-            # User canceled
-            timer.stop()
+            # User canceled - the finished signal has already stopped the timer
             self.shutdown_canceled.emit()
             if self.output_callback:
                 self.output_callback(
@@ -188,8 +183,9 @@ class ShutdownManager(QObject):
             else:
                 # Linux - try different methods
                 try:
-                    # Try systemd first
-                    result = os.system("systemctl poweroff")
+                    # Try systemd first, with a timeout so a wedged
+                    # systemctl can't hang the countdown indefinitely
+                    result = subprocess.run(["systemctl", "poweroff"], timeout=5).returncode
                     if result != 0:
                         # Try dbus
                         from pydbus import SystemBus
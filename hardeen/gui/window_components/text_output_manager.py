@@ -1,9 +1,12 @@
 import threading
-from typing import List, Tuple, Callable, Optional, Any
+from collections import deque
+from typing import Deque, List, Tuple, Callable, Optional, Any
 from PySide6.QtCore import QObject, QTimer, Qt
-from PySide6.QtWidgets import QTextEdit, QApplication
+from PySide6.QtWidgets import QTextEdit, QPlainTextEdit, QApplication
 from PySide6.QtGui import QTextCursor, QTextCharFormat, QTextBlockFormat, QColor, QFont
 
+from ...config import LOG_MAX_BLOCKS
+
 class TextOutputManager(QObject):
     """
     Manages text output functionality for the application.
@@ -14,18 +17,24 @@ class TextOutputManager(QObject):
     - Managing scrolling behavior
     """
 
-    def __init__(self, parent=None, summary_text_widget: Optional[QTextEdit] = None, raw_text_widget: Optional[QTextEdit] = None):
+    def __init__(self, parent=None, summary_text_widget: Optional[QTextEdit] = None, raw_text_widget: Optional[QPlainTextEdit] = None):
         """Initialize text output manager with necessary widgets and queues"""
         super().__init__(parent)
 
         self.summary_text = summary_text_widget
         self.raw_text = raw_text_widget
+        self._apply_document_limits()
+
+        # Create update queues - deque append/popleft are atomic under the
+        # GIL, so producers on the render thread need no lock
+        self.summary_update_queue: Deque[Tuple[str, Optional[str], bool, bool]] = deque()
+        self.raw_update_queue: Deque[str] = deque()
 
-        # Create update queues and locks for thread safety
-        self.summary_update_queue: List[Tuple[str, Optional[str], bool, bool]] = []
-        self.summary_update_lock = threading.Lock()
-        self.raw_update_queue: List[str] = []
-        self.raw_update_lock = threading.Lock()
+        # Lines drained while the raw panel is collapsed are parked here
+        # instead of being laid out into a widget nobody can see; the
+        # maxlen matches the widget's own block cap, so older lines fall
+        # off exactly as they would have in the document
+        self._raw_backlog: Deque[str] = deque(maxlen=LOG_MAX_BLOCKS)
 
         # Create update timers in the main thread
         self.summary_update_timer = QTimer(self)
@@ -38,15 +47,22 @@ class TextOutputManager(QObject):
         # Start timers
         self.start_timers()
 
-    def set_text_widgets(self, summary_text_widget: QTextEdit, raw_text_widget: QTextEdit):
+    def set_text_widgets(self, summary_text_widget: QTextEdit, raw_text_widget: QPlainTextEdit):
         """Set or update the text widget references"""
         self.summary_text = summary_text_widget
         self.raw_text = raw_text_widget
+        self._apply_document_limits()
+
+    def _apply_document_limits(self):
+        """Bound both log documents so layout cost stays flat during long renders"""
+        if self.summary_text:
+            self.summary_text.document().setMaximumBlockCount(LOG_MAX_BLOCKS)
+        if self.raw_text:
+            self.raw_text.setMaximumBlockCount(LOG_MAX_BLOCKS)
 
     def append_output_safe(self, text: str, color: Optional[str] = None, bold: bool = False, center: bool = False):
         """Queue summary text updates to be processed in the main thread"""
-        with self.summary_update_lock:
-            self.summary_update_queue.append((text, color, bold, center))
+        self.summary_update_queue.append((text, color, bold, center))
 
     def process_summary_updates(self):
         """Process queued summary text updates in the main thread"""
@@ -54,12 +70,10 @@ class TextOutputManager(QObject):
         if not self.summary_text:
             return
 
-        updates = []
-        with self.summary_update_lock:
-            if not self.summary_update_queue:
-                return
-            updates = self.summary_update_queue.copy()
-            self.summary_update_queue.clear()
+        updates = self._drain_queue(self.summary_update_queue)
+        self._retune_timer(self.summary_update_timer, len(updates))
+        if not updates:
+            return
 
         # Check if scrollbar is at the bottom before adding text
         scrollbar = self.summary_text.verticalScrollBar()
@@ -71,22 +85,44 @@ class TextOutputManager(QObject):
         cursor.movePosition(QTextCursor.MoveOperation.End)
         self.summary_text.setTextCursor(cursor)
 
-        for text, color, bold, center in updates:
-            # Format and insert new text
-            format = QTextCharFormat()
-
-            if color:
-                format.setForeground(QColor(color))
-            if bold:
-                format.setFontWeight(QFont.Weight.Bold)
-            if center:
-                cursor.insertBlock()
-                blockFormat = QTextBlockFormat()
-                blockFormat.setAlignment(Qt.AlignmentFlag.AlignCenter)
-                cursor.setBlockFormat(blockFormat)
-
-            cursor.insertText(text, format)
-            cursor.setBlockFormat(QTextBlockFormat())  # Reset block format to default (left-aligned)
+        # Suspend repaints while the batch is inserted so the document is
+        # laid out once at the end instead of after every insert
+        self.summary_text.setUpdatesEnabled(False)
+        try:
+            index = 0
+            count = len(updates)
+            while index < count:
+                text, color, bold, center = updates[index]
+
+                format = QTextCharFormat()
+                if color:
+                    format.setForeground(QColor(color))
+                if bold:
+                    format.setFontWeight(QFont.Weight.Bold)
+
+                if center:
+                    cursor.insertBlock()
+                    blockFormat = QTextBlockFormat()
+                    blockFormat.setAlignment(Qt.AlignmentFlag.AlignCenter)
+                    cursor.setBlockFormat(blockFormat)
+                else:
+                    # Merge consecutive left-aligned entries with identical
+                    # formatting into a single insert
+                    merged = [text]
+                    while index + 1 < count:
+                        next_text, next_color, next_bold, next_center = updates[index + 1]
+                        if next_center or next_color != color or next_bold != bold:
+                            break
+                        merged.append(next_text)
+                        index += 1
+                    if len(merged) > 1:
+                        text = ''.join(merged)
+
+                cursor.insertText(text, format)
+                cursor.setBlockFormat(QTextBlockFormat())  # Reset block format to default (left-aligned)
+                index += 1
+        finally:
+            self.summary_text.setUpdatesEnabled(True)
 
         self.summary_text.setTextCursor(cursor)
 
@@ -96,8 +132,7 @@ class TextOutputManager(QObject):
 
     def append_raw_output_safe(self, text: str):
         """Queue raw text updates to be processed in the main thread"""
-        with self.raw_update_lock:
-            self.raw_update_queue.append(text)
+        self.raw_update_queue.append(text)
 
     def process_raw_updates(self):
         """Process queued raw text updates in the main thread"""
@@ -105,32 +140,65 @@ class TextOutputManager(QObject):
         if not self.raw_text:
             return
 
-        updates = []
-        with self.raw_update_lock:
-            if not self.raw_update_queue:
-                return
-            updates = self.raw_update_queue.copy()
-            self.raw_update_queue.clear()
+        updates = self._drain_queue(self.raw_update_queue)
+        self._retune_timer(self.raw_update_timer, len(updates))
+
+        # While the panel is hidden or dragged shut in the splitter, skip
+        # the Qt insert entirely and hold the lines in the backlog
+        if not self.raw_text.isVisible() or self.raw_text.width() == 0:
+            self._raw_backlog.extend(updates)
+            return
+
+        # Panel is visible again - prepend anything parked while it wasn't
+        if self._raw_backlog:
+            self._raw_backlog.extend(updates)
+            updates = list(self._raw_backlog)
+            self._raw_backlog.clear()
+
+        if not updates:
+            return
 
         # Check if scrollbar is at the bottom before adding text
         scrollbar = self.raw_text.verticalScrollBar()
         at_bottom = scrollbar.value() == scrollbar.maximum()
 
-        # Clear any text selection and move cursor to end
-        cursor = self.raw_text.textCursor()
-        cursor.clearSelection()
-        cursor.movePosition(QTextCursor.MoveOperation.End)
-        self.raw_text.setTextCursor(cursor)
-
-        for text in updates:
-            cursor.insertText(text + '\n')  # Add newline after each line
-
-        self.raw_text.setTextCursor(cursor)
+        # Merge the batch into a single append - each insert triggers a
+        # document relayout, so one per tick instead of one per line is
+        # the real saving. appendPlainText manages its own cursor, so the
+        # user's selection and view position are left alone.
+        self.raw_text.appendPlainText('\n'.join(updates))
 
         # Only scroll to bottom if we were already at the bottom
         if at_bottom:
             scrollbar.setValue(scrollbar.maximum())
 
+    @staticmethod
+    def _retune_timer(timer: QTimer, batch_size: int):
+        """Adapt a drain timer's cadence to queue pressure.
+
+        Idle ticks during quiet stretches (or when no render is running)
+        are pure wasted wakeups, while a Redshift log burst benefits from
+        a faster drain so the queue doesn't balloon between ticks.
+        """
+        if batch_size > 200:
+            interval = 50
+        elif batch_size > 0:
+            interval = 100
+        else:
+            interval = 500
+        if timer.interval() != interval:
+            timer.setInterval(interval)
+
+    @staticmethod
+    def _drain_queue(queue: Deque) -> List:
+        """Drain a queue into a list without locking (popleft is atomic)"""
+        batch = []
+        while True:
+            try:
+                batch.append(queue.popleft())
+            except IndexError:
+                return batch
+
     def start_timers(self):
         """Start the update timers"""
         self.summary_update_timer.start(100)
@@ -156,12 +224,15 @@ class TextOutputManager(QObject):
         # Stop timers to prevent new updates during processing
         self.stop_timers()
 
-        # Process any remaining text updates
+        # Process any remaining text updates. The raw backlog is flushed
+        # into the widget even if the panel is collapsed so nothing is
+        # lost across the final drain.
         self.process_summary_updates()
         self.process_raw_updates()
+        if self.raw_text and self._raw_backlog:
+            self.raw_text.appendPlainText('\n'.join(self._raw_backlog))
+            self._raw_backlog.clear()
 
         # Clear text update queues
-        with self.summary_update_lock:
-            self.summary_update_queue.clear()
-        with self.raw_update_lock:
-            self.raw_update_queue.clear()
+        self.summary_update_queue.clear()
+        self.raw_update_queue.clear()
@@ -1,14 +1,16 @@
 import OpenImageIO as oiio
 import numpy as np
-from PIL import Image
-from PySide6.QtGui import QPixmap, QImage
+from PySide6.QtGui import QImage
 import os
 import traceback
 import time
 
 def load_exr_aovs(image_path, max_aovs=20, max_retries=3):
     """
-    Load an EXR file, extract all AOVs/subimages, and return a list of (QPixmap, label) tuples.
+    Load an EXR file, extract all AOVs/subimages, and return a list of (QImage, label) tuples.
+
+    QImage rather than QPixmap so this can run on a worker thread -
+    pixmaps may only be created on the GUI thread.
 
     Args:
         image_path: Path to the EXR file
@@ -16,7 +18,7 @@ def load_exr_aovs(image_path, max_aovs=20, max_retries=3):
         max_retries: Maximum number of retries for loading the file
 
     Returns:
-        List of (QPixmap, label) tuples for each AOV
+        List of (QImage, label) tuples for each AOV
     """
     images = []
 
@@ -182,25 +184,33 @@ def load_exr_aovs(image_path, max_aovs=20, max_retries=3):
                                 if pixels.shape[2] > 3:
                                     pixels = pixels[:, :, :3]
                                 else:
-                                    padding = np.zeros((*pixels.shape[:2], 3-pixels.shape[2]))
+                                    # Match dtype so concatenate doesn't upcast
+                                    # the whole image to float64
+                                    padding = np.zeros((*pixels.shape[:2], 3-pixels.shape[2]), dtype=pixels.dtype)
                                     pixels = np.concatenate([pixels, padding], axis=2)
                         elif len(pixels.shape) == 2:  # Single channel
                             pixels = np.stack([pixels] * 3, axis=2)
 
-                        # Normalize the float data to 0-1 range
-                        pixels = np.clip(pixels, 0, 1)
-
-                        # Convert to 8-bit
-                        pixels = (pixels * 255).astype(np.uint8)
-
-                        # Convert to QPixmap through PIL Image
-                        img = Image.fromarray(pixels)
-                        img_bytes = img.tobytes("raw", "RGB")
-                        qimg = QImage(img_bytes, img.width, img.height, QImage.Format.Format_RGB888)
-                        pixmap = QPixmap.fromImage(qimg)
+                        # Scale, clamp and convert to 8-bit. The multiply and
+                        # clip run in place so only the final uint8 cast
+                        # allocates, instead of one full-size float temporary
+                        # per step
+                        np.multiply(pixels, 255.0, out=pixels)
+                        np.clip(pixels, 0.0, 255.0, out=pixels)
+                        pixels = pixels.astype(np.uint8)
+
+                        # Wrap the ndarray buffer directly as a QImage -
+                        # no intermediate PIL image or tobytes() copy.
+                        # copy() detaches the image into its own buffer so
+                        # the array can be released afterwards.
+                        height, width = pixels.shape[:2]
+                        if pixels.shape[2] == 4:
+                            qimg = QImage(pixels.data, width, height, 4 * width, QImage.Format.Format_RGBA8888)
+                        else:
+                            qimg = QImage(pixels.data, width, height, 3 * width, QImage.Format.Format_RGB888)
 
                         # Add to result list
-                        images.append((pixmap, layer_str))
+                        images.append((qimg.copy(), layer_str))
 
                     except Exception as e:
                         print(f"EXR ERROR: Failed to process subimage {subCount}: {str(e)}")
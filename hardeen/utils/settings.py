@@ -5,45 +5,78 @@ from typing import Any, List, Optional, Dict, Union
 class Settings:
     """Wrapper for QSettings to handle lists and other data types"""
 
+    __slots__ = ('settings', '_cache', '_list_cache')
+
     def __init__(self):
         from ..config import APP_NAME, APP_ORGANIZATION
         self.settings = QSettings(APP_ORGANIZATION, APP_NAME)
+        # In-process caches so hot paths don't re-read QSettings storage
+        # (and re-parse string booleans) on every access
+        self._cache: Dict[str, Any] = {}
+        self._list_cache: Dict[str, List] = {}
 
     def get(self, key: str, default: Any = None) -> Any:
         """Get a value from settings"""
+        if key in self._cache:
+            value = self._cache[key]
+            return value if value is not None else default
+
+        if not self.settings.contains(key):
+            return default
+
         value = self.settings.value(key, default)
 
         # Convert string booleans back to bool
         if isinstance(value, str):
             if value.lower() == 'true':
-                return True
+                value = True
             elif value.lower() == 'false':
-                return False
+                value = False
 
+        self._cache[key] = value
         return value if value is not None else default
 
     def set(self, key: str, value: Any) -> None:
         """Save a value to settings"""
+        # Skip the storage write when a scalar hasn't changed. Lists are
+        # exempt: a caller may mutate one in place between sets, which
+        # would make the cached comparison lie about the backing store.
+        if not isinstance(value, (list, dict)) and key in self._cache \
+                and self._cache[key] == value:
+            return
+        self._cache[key] = value
+        self._list_cache.pop(key, None)
         self.settings.setValue(key, value)
 
     def get_list(self, key: str, default: Optional[List] = None) -> List:
         """Get a list from settings"""
+        if key in self._list_cache:
+            return self._list_cache[key]
+
         value = self.settings.value(key, default or [])
         if isinstance(value, str):
             # Handle single string value
-            return [value] if value else []
-        return value if isinstance(value, list) else []
+            value = [value] if value else []
+        elif not isinstance(value, list):
+            value = []
+
+        self._list_cache[key] = value
+        return value
 
     def contains(self, key: str) -> bool:
         """Check if a key exists in settings"""
-        return self.settings.contains(key)
+        return key in self._cache or self.settings.contains(key)
 
     def remove(self, key: str) -> None:
         """Remove a key from settings"""
+        self._cache.pop(key, None)
+        self._list_cache.pop(key, None)
         self.settings.remove(key)
 
     def clear(self) -> None:
         """Clear all settings"""
+        self._cache.clear()
+        self._list_cache.clear()
         self.settings.clear()
 
     def sync(self) -> None:
@@ -1,5 +1,8 @@
 """Utility functions for working with time and durations"""
 
+from functools import lru_cache
+
+
 def format_time(seconds):
     """Format seconds into human readable time
 
@@ -9,14 +12,17 @@ def format_time(seconds):
     Returns:
         str: Formatted time string like "1h 30m 45s" or "45.5s"
     """
+    # Quantize to the displayed resolution so repeated progress updates
+    # hit the cache instead of re-formatting every call
+    return _format_time_cached(round(seconds, 1))
+
+
+@lru_cache(maxsize=4096)
+def _format_time_cached(seconds):
     if seconds < 60:
         return f"{seconds:.1f}s"
-    elif seconds < 3600:
-        minutes = int(seconds / 60)
-        seconds = seconds % 60
-        return f"{minutes}m {seconds:.1f}s"
-    else:
-        hours = int(seconds / 3600)
-        minutes = int((seconds % 3600) / 60)
-        seconds = seconds % 60
-        return f"{hours}h {minutes}m {seconds:.1f}s"
+    minutes, secs = divmod(seconds, 60)
+    if minutes < 60:
+        return f"{int(minutes)}m {secs:.1f}s"
+    hours, minutes = divmod(int(minutes), 60)
+    return f"{hours}h {minutes}m {secs:.1f}s"